@@ -10,7 +10,7 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from functools import wraps
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, TextIO, TypeVar
 
 from export_control_mcp.config import settings
 from export_control_mcp.models.errors import AuditLogError
@@ -61,16 +61,27 @@ def _summarize_result(result: Any) -> str:
     return str(type(result).__name__)
 
 
+def _open_for_append(log_path: Path) -> TextIO:
+    """
+    Open the audit log for appending, creating its directory if needed.
+
+    The directory almost always exists already, so it is only created
+    after the open fails rather than checked on every write.
+    """
+    try:
+        return open(log_path, "a", encoding="utf-8")
+    except FileNotFoundError:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(log_path, "a", encoding="utf-8")
+
+
 def _write_audit_log(entry: dict[str, Any]) -> None:
     """Write an entry to the audit log file."""
     log_path = Path(settings.audit_log_path)
 
     try:
-        # Ensure directory exists
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Append to JSONL file
-        with open(log_path, "a", encoding="utf-8") as f:
+        with _open_for_append(log_path) as f:
             f.write(json.dumps(entry, default=str) + "\n")
 
     except Exception as e:
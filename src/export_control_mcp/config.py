@@ -32,6 +32,15 @@ class Settings(BaseSettings):
     chroma_persist_dir: str = "./data/chroma"
     sanctions_db_path: str = "./data/sanctions.db"
 
+    # Vector Index Configuration (HNSW, applied when a collection is created)
+    chroma_hnsw_m: int = 24
+    chroma_hnsw_construction_ef: int = 128
+    chroma_hnsw_search_ef: int = 100
+
+    # Sanctions Search Configuration
+    # Worker threads (each with its own read connection) for async searches
+    sanctions_search_workers: int = 4
+
     # Logging Configuration
     log_level: str = "INFO"
     audit_log_path: str = "./logs/audit.jsonl"
@@ -330,22 +330,23 @@ class CSLIngestor:
             result["errors"].append(f"Failed to parse CSL: {e}")
             return result
 
-        # Store entries by list type
+        # Store entries by list type, committing them as one transaction
         list_counts: dict[str, int] = {}
 
-        for entry in entries:
-            try:
-                # Store in appropriate table based on source
-                self._store_entry(entry)
+        with self.db.bulk_write():
+            for entry in entries:
+                try:
+                    # Store in appropriate table based on source
+                    self._store_entry(entry)
 
-                # Track counts
-                list_code = entry.source_list_code
-                list_counts[list_code] = list_counts.get(list_code, 0) + 1
-                result["total_entries"] += 1
+                    # Track counts
+                    list_code = entry.source_list_code
+                    list_counts[list_code] = list_counts.get(list_code, 0) + 1
+                    result["total_entries"] += 1
 
-            except Exception as e:
-                if len(result["errors"]) < 10:
-                    result["errors"].append(f"Error storing {entry.name}: {e}")
+                except Exception as e:
+                    if len(result["errors"]) < 10:
+                        result["errors"].append(f"Error storing {entry.name}: {e}")
 
         # Add list-level statistics
         for code, count in list_counts.items():
@@ -94,6 +94,16 @@ class DecisionTreeStep(BaseModel):
         description="Relevant CFR or regulation reference",
     )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for MCP tool response."""
+        return {
+            "step_number": self.step_number,
+            "question": self.question,
+            "guidance": self.guidance,
+            "options": list(self.options),
+            "regulation_reference": self.regulation_reference,
+        }
+
 
 class DecisionTreeResult(BaseModel):
     """Result of walking through the classification decision tree."""
@@ -120,25 +130,8 @@ class DecisionTreeResult(BaseModel):
         """Convert to dictionary for MCP tool response."""
         return {
             "item_description": self.item_description,
-            "completed_steps": [
-                {
-                    "step_number": step.step_number,
-                    "question": step.question,
-                    "guidance": step.guidance,
-                    "options": step.options,
-                    "regulation_reference": step.regulation_reference,
-                }
-                for step in self.completed_steps
-            ],
-            "current_step": {
-                "step_number": self.current_step.step_number,
-                "question": self.current_step.question,
-                "guidance": self.current_step.guidance,
-                "options": self.current_step.options,
-                "regulation_reference": self.current_step.regulation_reference,
-            }
-            if self.current_step
-            else None,
+            "completed_steps": [step.to_dict() for step in self.completed_steps],
+            "current_step": self.current_step.to_dict() if self.current_step else None,
             "preliminary_result": self.preliminary_result,
             "is_complete": self.is_complete,
         }
@@ -41,16 +41,16 @@ class SearchResult(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for MCP tool response."""
+        chunk = self.chunk
+        content = chunk.content
         return {
-            "id": self.chunk.id,
-            "regulation_type": self.chunk.regulation_type.value,
-            "part": self.chunk.part,
-            "section": self.chunk.section,
-            "title": self.chunk.title,
-            "content": self.chunk.content[:500] + "..."
-            if len(self.chunk.content) > 500
-            else self.chunk.content,
-            "citation": self.chunk.citation,
+            "id": chunk.id,
+            "regulation_type": chunk.regulation_type.value,
+            "part": chunk.part,
+            "section": chunk.section,
+            "title": chunk.title,
+            "content": content[:500] + "..." if len(content) > 500 else content,
+            "citation": chunk.citation,
             "score": round(self.score, 3),
         }
 
@@ -219,17 +219,19 @@ class CountrySanctions(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for MCP tool response."""
+        # Preloaded profiles are shared across calls, so hand out copies of
+        # their lists rather than the lists themselves
         return {
             "country_code": self.country_code,
             "country_name": self.country_name,
-            "ofac_programs": self.ofac_programs,
+            "ofac_programs": list(self.ofac_programs),
             "embargo_type": self.embargo_type,
-            "ear_country_groups": self.ear_country_groups,
+            "ear_country_groups": list(self.ear_country_groups),
             "itar_restricted": self.itar_restricted,
             "arms_embargo": self.arms_embargo,
             "summary": self.summary,
-            "key_restrictions": self.key_restrictions,
-            "notes": self.notes,
+            "key_restrictions": list(self.key_restrictions),
+            "notes": list(self.notes),
         }
 
 
@@ -16,6 +16,16 @@ logger = logging.getLogger(__name__)
 # Path to the JSON data file
 _DATA_FILE = Path(__file__).parent / "data" / "country_sanctions.json"
 
+# Common alternative names, mapped to country codes
+_COUNTRY_ALIASES = {
+    "dprk": "KP",
+    "democratic people's republic of korea": "KP",
+    "russian federation": "RU",
+    "prc": "CN",
+    "people's republic of china": "CN",
+    "syrian arab republic": "SY",
+}
+
 
 def _load_country_sanctions_data() -> dict[str, CountrySanctions]:
     """
@@ -88,22 +98,48 @@ def get_country_sanctions(country_code: str) -> CountrySanctions | None:
     return data.get(country_code.upper())
 
 
+@lru_cache(maxsize=1)
+def _lowercase_names() -> tuple[tuple[str, CountrySanctions], ...]:
+    """Pair each loaded country's lowercased name with its sanctions data."""
+    return tuple(
+        (sanctions.country_name.lower(), sanctions)
+        for sanctions in get_country_sanctions_data().values()
+    )
+
+
+@lru_cache(maxsize=1)
+def _country_name_index() -> dict[str, CountrySanctions]:
+    """Map lowercased country names and aliases to their sanctions data."""
+    data = get_country_sanctions_data()
+    index: dict[str, CountrySanctions] = {}
+    for country_lower, sanctions in _lowercase_names():
+        index.setdefault(country_lower, sanctions)
+    for alias, code in _COUNTRY_ALIASES.items():
+        if code in data:
+            index.setdefault(alias, data[code])
+    return index
+
+
 def get_country_by_name(name: str) -> CountrySanctions | None:
     """
     Get sanctions data for a country by name (partial match).
 
+    An exact name or common alias is preferred over a partial match.
+
     Args:
         name: Country name or partial name.
 
     Returns:
         CountrySanctions object if found, None otherwise.
     """
-    data = get_country_sanctions_data()
     name_lower = name.lower()
+    sanctions = _country_name_index().get(name_lower.strip())
+    if sanctions is not None:
+        return sanctions
 
-    for sanctions in data.values():
-        if name_lower in sanctions.country_name.lower():
-            return sanctions
+    for country_lower, candidate in _lowercase_names():
+        if name_lower in country_lower:
+            return candidate
 
     return None
 
@@ -115,5 +151,7 @@ def reload_country_sanctions_data() -> None:
     Call this after updating the JSON file to pick up changes.
     """
     get_country_sanctions_data.cache_clear()
+    _lowercase_names.cache_clear()
+    _country_name_index.cache_clear()
     # Pre-load to verify data is valid
     get_country_sanctions_data()
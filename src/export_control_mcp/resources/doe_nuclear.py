@@ -37,7 +37,7 @@ class CFR810Country:
 # Generally Authorized Destinations (10 CFR 810 Appendix A)
 # These countries can receive certain nuclear technology assistance
 # without specific DOE authorization (as of November 2025)
-GENERALLY_AUTHORIZED_DESTINATIONS = [
+GENERALLY_AUTHORIZED_DESTINATIONS = (
     "Argentina",
     "Australia",
     "Austria",
@@ -87,7 +87,7 @@ GENERALLY_AUTHORIZED_DESTINATIONS = [
     "United Arab Emirates",
     "United Kingdom",
     "Vietnam",
-]
+)
 
 # Countries with 123 Agreements but NOT in Appendix A
 # (require specific authorization for all Part 810 activities)
@@ -111,12 +111,12 @@ SPECIFIC_AUTHORIZATION_WITH_123 = {
 }
 
 # Prohibited destinations (comprehensive sanctions or no nuclear cooperation)
-PROHIBITED_DESTINATIONS = [
+PROHIBITED_DESTINATIONS = (
     "Cuba",
     "Iran",
     "North Korea",
     "Syria",
-]
+)
 
 # ISO country code mapping for common lookups
 COUNTRY_ISO_CODES = {
@@ -237,6 +237,63 @@ SPECIFIC_AUTHORIZATION_ACTIVITIES = {
 }
 
 
+# Common variations of country names (lowercased) and the listed name
+_COUNTRY_ALIASES = {
+    "south korea": "Korea, Republic of",
+    "republic of korea": "Korea, Republic of",
+    "rok": "Korea, Republic of",
+    "uae": "United Arab Emirates",
+    "uk": "United Kingdom",
+    "great britain": "United Kingdom",
+    "dprk": "North Korea",
+}
+
+
+def _build_listed_countries() -> dict[str, tuple[str, CFR810AuthorizationType, bool, str]]:
+    """
+    Index every listed country by lowercased name.
+
+    Values are (name, authorization type, has 123 Agreement, notes). Lists
+    are applied in lookup precedence: Generally Authorized, then
+    Prohibited, then Specific Authorization with a 123 Agreement.
+    """
+    index: dict[str, tuple[str, CFR810AuthorizationType, bool, str]] = {}
+    for dest in GENERALLY_AUTHORIZED_DESTINATIONS:
+        index.setdefault(
+            dest.lower(),
+            (
+                dest,
+                CFR810AuthorizationType.GENERALLY_AUTHORIZED,
+                True,
+                "Listed in Appendix A to 10 CFR 810",
+            ),
+        )
+    for dest in PROHIBITED_DESTINATIONS:
+        index.setdefault(
+            dest.lower(),
+            (
+                dest,
+                CFR810AuthorizationType.PROHIBITED,
+                False,
+                "Subject to comprehensive sanctions; nuclear assistance prohibited",
+            ),
+        )
+    for dest, info in SPECIFIC_AUTHORIZATION_WITH_123.items():
+        index.setdefault(
+            dest.lower(),
+            (
+                dest,
+                CFR810AuthorizationType.SPECIFIC_AUTHORIZATION,
+                bool(info["has_123_agreement"]),
+                str(info["notes"]),
+            ),
+        )
+    return index
+
+
+_LISTED_COUNTRIES = _build_listed_countries()
+
+
 def get_cfr810_authorization(country: str) -> CFR810Country | None:
     """
     Determine 10 CFR 810 authorization status for a country.
@@ -250,52 +307,21 @@ def get_cfr810_authorization(country: str) -> CFR810Country | None:
     country_normalized = country.strip()
 
     # Handle common variations
-    country_map = {
-        "south korea": "Korea, Republic of",
-        "republic of korea": "Korea, Republic of",
-        "rok": "Korea, Republic of",
-        "uae": "United Arab Emirates",
-        "uk": "United Kingdom",
-        "great britain": "United Kingdom",
-        "dprk": "North Korea",
-    }
-
     country_lower = country_normalized.lower()
-    if country_lower in country_map:
-        country_normalized = country_map[country_lower]
+    if country_lower in _COUNTRY_ALIASES:
+        country_normalized = _COUNTRY_ALIASES[country_lower]
+        country_lower = country_normalized.lower()
 
-    # Check Generally Authorized
-    for dest in GENERALLY_AUTHORIZED_DESTINATIONS:
-        if dest.lower() == country_normalized.lower():
-            return CFR810Country(
-                name=dest,
-                iso_code=COUNTRY_ISO_CODES.get(dest, ""),
-                authorization_type=CFR810AuthorizationType.GENERALLY_AUTHORIZED,
-                has_123_agreement=True,
-                notes="Listed in Appendix A to 10 CFR 810",
-            )
-
-    # Check Prohibited
-    for dest in PROHIBITED_DESTINATIONS:
-        if dest.lower() == country_normalized.lower():
-            return CFR810Country(
-                name=dest,
-                iso_code=COUNTRY_ISO_CODES.get(dest, ""),
-                authorization_type=CFR810AuthorizationType.PROHIBITED,
-                has_123_agreement=False,
-                notes="Subject to comprehensive sanctions; nuclear assistance prohibited",
-            )
-
-    # Check Specific Authorization with 123 Agreement
-    for dest, info in SPECIFIC_AUTHORIZATION_WITH_123.items():
-        if dest.lower() == country_normalized.lower():
-            return CFR810Country(
-                name=dest,
-                iso_code=COUNTRY_ISO_CODES.get(dest, ""),
-                authorization_type=CFR810AuthorizationType.SPECIFIC_AUTHORIZATION,
-                has_123_agreement=bool(info["has_123_agreement"]),
-                notes=str(info["notes"]),
-            )
+    listed = _LISTED_COUNTRIES.get(country_lower)
+    if listed is not None:
+        name, authorization_type, has_123_agreement, notes = listed
+        return CFR810Country(
+            name=name,
+            iso_code=COUNTRY_ISO_CODES.get(name, ""),
+            authorization_type=authorization_type,
+            has_123_agreement=has_123_agreement,
+            notes=notes,
+        )
 
     # Default: Specific authorization required (not in Appendix A)
     iso = COUNTRY_ISO_CODES.get(country_normalized, "")
@@ -344,12 +370,12 @@ def is_prohibited_destination(country: str) -> bool:
 
 def get_all_generally_authorized() -> list[str]:
     """Return list of all Generally Authorized Destinations."""
-    return GENERALLY_AUTHORIZED_DESTINATIONS.copy()
+    return list(GENERALLY_AUTHORIZED_DESTINATIONS)
 
 
 def get_all_prohibited() -> list[str]:
     """Return list of all prohibited destinations."""
-    return PROHIBITED_DESTINATIONS.copy()
+    return list(PROHIBITED_DESTINATIONS)
 
 
 # Part 810 Guidance for National Labs
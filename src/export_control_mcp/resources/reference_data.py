@@ -723,6 +723,20 @@ COUNTRY_GROUPS: dict[str, dict[str, Any]] = {
 }
 
 
+def _build_country_group_index() -> dict[str, tuple[str, ...]]:
+    """Map each lowercased country name to its group codes in table order."""
+    index: dict[str, list[str]] = {}
+    for group_code, group_data in COUNTRY_GROUPS.items():
+        countries = group_data.get("countries", [])
+        if isinstance(countries, list):
+            for country_lower in dict.fromkeys(c.lower() for c in countries):
+                index.setdefault(country_lower, []).append(group_code)
+    return {country: tuple(groups) for country, groups in index.items()}
+
+
+_COUNTRY_GROUP_INDEX = _build_country_group_index()
+
+
 def get_country_groups(country: str) -> list[str]:
     """
     Get all country groups that include a given country.
@@ -733,18 +747,7 @@ def get_country_groups(country: str) -> list[str]:
     Returns:
         List of country group codes the country belongs to
     """
-    country_lower = country.lower().strip()
-    groups = []
-
-    for group_code, group_data in COUNTRY_GROUPS.items():
-        countries = group_data.get("countries", [])
-        if isinstance(countries, list):
-            for c in countries:
-                if c.lower() == country_lower:
-                    groups.append(group_code)
-                    break
-
-    return groups
+    return list(_COUNTRY_GROUP_INDEX.get(country.lower().strip(), ()))
 
 
 # Export control glossary
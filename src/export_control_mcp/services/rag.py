@@ -1,5 +1,8 @@
 """RAG (Retrieval-Augmented Generation) service for regulation search."""
 
+from functools import lru_cache
+from typing import Any
+
 from export_control_mcp.models.errors import RegulationNotFoundError
 from export_control_mcp.models.regulations import (
     RegulationChunk,
@@ -7,12 +10,26 @@ from export_control_mcp.models.regulations import (
     SearchResult,
 )
 from export_control_mcp.services.embeddings import EmbeddingService
-from export_control_mcp.services.vector_store import VectorStoreService
+from export_control_mcp.services.vector_store import VectorStoreService, metadata_to_chunk
+
+
+def _to_search_results(results: list[tuple[dict[str, Any], float]]) -> list[SearchResult]:
+    """Convert vector store (metadata, score) hits to SearchResult objects."""
+    return [
+        SearchResult(
+            chunk=metadata_to_chunk(metadata),
+            score=score,
+        )
+        for metadata, score in results
+    ]
 
 
 class RagService:
     """Retrieval-Augmented Generation service for export control regulations."""
 
+    # Distinct query strings whose embeddings are kept for reuse
+    QUERY_CACHE_SIZE = 1024
+
     def __init__(
         self,
         embedding_service: EmbeddingService,
@@ -27,6 +44,9 @@ class RagService:
         """
         self._embeddings = embedding_service
         self._vector_store = vector_store
+        # Users repeat the same queries, so skip the encoder for ones seen
+        # recently. Keyed on the exact text; cached vectors are only read.
+        self._embed_query = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(embedding_service.embed)
 
     async def search(
         self,
@@ -48,7 +68,7 @@ class RagService:
             Ranked list of regulation chunks with relevance scores.
         """
         # Generate query embedding
-        query_embedding = self._embeddings.embed(query)
+        query_embedding = self._embed_query(query)
 
         # Search vector store
         results = self._vector_store.search(
@@ -59,20 +79,7 @@ class RagService:
         )
 
         # Convert to SearchResult objects
-        search_results: list[SearchResult] = []
-        for metadata, score in results:
-            # Reconstruct RegulationChunk from stored JSON
-            full_json = metadata.get("full_json")
-            if full_json:
-                chunk = RegulationChunk.model_validate_json(full_json)
-                search_results.append(
-                    SearchResult(
-                        chunk=chunk,
-                        score=score,
-                    )
-                )
-
-        return search_results
+        return _to_search_results(results)
 
     async def search_ear(
         self,
@@ -122,6 +129,31 @@ class RagService:
             limit=limit,
         )
 
+    async def search_both(
+        self,
+        query: str,
+        limit: int = 10,
+    ) -> tuple[list[SearchResult], list[SearchResult]]:
+        """
+        Search EAR and ITAR separately for the same query.
+
+        Equivalent to calling search_ear() and search_itar(), but the query
+        is embedded only once and both collections are searched concurrently.
+
+        Args:
+            query: Natural language search query.
+            limit: Maximum number of results per regulation type.
+
+        Returns:
+            Tuple of (EAR results, ITAR results), each ranked by relevance.
+        """
+        query_embedding = self._embed_query(query)
+        results = self._vector_store.search_each_type(query_embedding, limit=limit)
+        return (
+            _to_search_results(results[RegulationType.EAR]),
+            _to_search_results(results[RegulationType.ITAR]),
+        )
+
     async def get_chunk(
         self,
         chunk_id: str,
@@ -145,11 +177,7 @@ class RagService:
         if metadata is None:
             raise RegulationNotFoundError(chunk_id, regulation_type.value)
 
-        full_json = metadata.get("full_json")
-        if not full_json:
-            raise RegulationNotFoundError(chunk_id, regulation_type.value)
-
-        return RegulationChunk.model_validate_json(full_json)
+        return metadata_to_chunk(metadata)
 
     def get_store_count(self, regulation_type: RegulationType | None = None) -> int:
         """Return the number of chunks in the vector store."""
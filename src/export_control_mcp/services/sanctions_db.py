@@ -1,12 +1,24 @@
 """SQLite-based sanctions database service with FTS5 and fuzzy matching."""
 
+import asyncio
 import json
+import math
 import sqlite3
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from rapidfuzz import fuzz
+import numpy as np
+import orjson
+from pydantic import BaseModel
+from rapidfuzz import fuzz, process
 
 from export_control_mcp.config import get_settings
 from export_control_mcp.models.sanctions import (
@@ -18,9 +30,26 @@ from export_control_mcp.models.sanctions import (
     SDNEntry,
 )
 
+_T = TypeVar("_T")
+
+# Prepared statements kept per connection. sqlite3 reuses a compiled statement
+# whenever the exact SQL text repeats, so hot queries keep their SQL stable.
+_STATEMENT_CACHE_SIZE = 256
+
 # Valid table names for SQL queries (prevents SQL injection)
 _VALID_TABLES = frozenset(["entity_list", "sdn_list", "denied_persons", "country_sanctions", "csl"])
 
+# Length of lower(name) as Python computes it: U+0130 is the only code point
+# that lowercases to two characters.
+_LOWER_NAME_LENGTH = "(2 * length(name) - length(replace(name, '\u0130', '')))"
+
+# Row counts for every table in a single round-trip. Built from the allowlist
+# at import time - safe for SQL interpolation.
+_STATS_SQL = " UNION ALL ".join(
+    f"SELECT '{table}', COUNT(*) FROM {table}"  # noqa: S608  # nosec B608
+    for table in sorted(_VALID_TABLES)
+)
+
 # =============================================================================
 # Database Schema Definitions (extracted for maintainability)
 # =============================================================================
@@ -121,7 +150,59 @@ CREATE VIRTUAL TABLE IF NOT EXISTS csl_fts USING fts5(
 )
 """
 
-# FTS sync triggers for each table
+# Drops the trigram index that earlier versions kept over CSL names, so
+# existing databases stop maintaining it on every CSL write
+_DROP_CSL_TRIGRAM = """
+DROP TRIGGER IF EXISTS csl_trigram_ai;
+DROP TRIGGER IF EXISTS csl_trigram_ad;
+DROP TRIGGER IF EXISTS csl_trigram_au;
+DROP TABLE IF EXISTS csl_trigram;
+"""
+
+# Normalized CSL countries so the country filter runs as an indexed lookup
+# instead of decoding every row's JSON list in Python
+_SCHEMA_CSL_COUNTRIES = """
+CREATE TABLE IF NOT EXISTS csl_countries (
+    csl_rowid INTEGER NOT NULL,
+    country TEXT NOT NULL COLLATE NOCASE
+)
+"""
+
+# The rowid index serves the sync triggers' deletes; without it every
+# deleted or updated CSL row scans the whole table
+_INDEX_CSL_COUNTRIES = """
+CREATE INDEX IF NOT EXISTS ix_csl_countries ON csl_countries(country, csl_rowid);
+CREATE INDEX IF NOT EXISTS ix_csl_countries_rowid ON csl_countries(csl_rowid);
+"""
+
+# Backfill for databases created before csl_countries existed
+_BACKFILL_CSL_COUNTRIES = """
+INSERT INTO csl_countries(csl_rowid, country)
+SELECT c.rowid, j.value FROM csl c, json_each(c.countries) j
+WHERE NOT EXISTS (SELECT 1 FROM csl_countries)
+"""
+
+# csl_countries sync triggers, kept separate from the FTS triggers so that
+# existing databases (whose csl_ai/csl_ad already exist) pick them up
+_TRIGGERS_CSL_COUNTRIES = """
+CREATE TRIGGER IF NOT EXISTS csl_countries_ai AFTER INSERT ON csl BEGIN
+    INSERT INTO csl_countries(csl_rowid, country)
+    SELECT new.rowid, value FROM json_each(new.countries);
+END;
+CREATE TRIGGER IF NOT EXISTS csl_countries_ad AFTER DELETE ON csl BEGIN
+    DELETE FROM csl_countries WHERE csl_rowid = old.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS csl_countries_au AFTER UPDATE ON csl
+WHEN old.countries IS NOT new.countries BEGIN
+    DELETE FROM csl_countries WHERE csl_rowid = old.rowid;
+    INSERT INTO csl_countries(csl_rowid, country)
+    SELECT new.rowid, value FROM json_each(new.countries);
+END;
+"""
+
+# FTS sync triggers for each table. Update triggers are recreated on startup
+# so existing databases pick up the WHEN clause that skips re-indexing rows
+# whose searchable text did not change.
 _TRIGGERS_ENTITY_LIST = """
 CREATE TRIGGER IF NOT EXISTS entity_list_ai AFTER INSERT ON entity_list BEGIN
     INSERT INTO entity_list_fts(rowid, name, aliases) VALUES (new.rowid, new.name, new.aliases);
@@ -130,7 +211,9 @@ CREATE TRIGGER IF NOT EXISTS entity_list_ad AFTER DELETE ON entity_list BEGIN
     INSERT INTO entity_list_fts(entity_list_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
 END;
-CREATE TRIGGER IF NOT EXISTS entity_list_au AFTER UPDATE ON entity_list BEGIN
+DROP TRIGGER IF EXISTS entity_list_au;
+CREATE TRIGGER entity_list_au AFTER UPDATE ON entity_list
+WHEN old.name IS NOT new.name OR old.aliases IS NOT new.aliases BEGIN
     INSERT INTO entity_list_fts(entity_list_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
     INSERT INTO entity_list_fts(rowid, name, aliases) VALUES (new.rowid, new.name, new.aliases);
@@ -145,7 +228,9 @@ CREATE TRIGGER IF NOT EXISTS sdn_list_ad AFTER DELETE ON sdn_list BEGIN
     INSERT INTO sdn_list_fts(sdn_list_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
 END;
-CREATE TRIGGER IF NOT EXISTS sdn_list_au AFTER UPDATE ON sdn_list BEGIN
+DROP TRIGGER IF EXISTS sdn_list_au;
+CREATE TRIGGER sdn_list_au AFTER UPDATE ON sdn_list
+WHEN old.name IS NOT new.name OR old.aliases IS NOT new.aliases BEGIN
     INSERT INTO sdn_list_fts(sdn_list_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
     INSERT INTO sdn_list_fts(rowid, name, aliases) VALUES (new.rowid, new.name, new.aliases);
@@ -160,7 +245,9 @@ CREATE TRIGGER IF NOT EXISTS denied_persons_ad AFTER DELETE ON denied_persons BE
     INSERT INTO denied_persons_fts(denied_persons_fts, rowid, name)
     VALUES('delete', old.rowid, old.name);
 END;
-CREATE TRIGGER IF NOT EXISTS denied_persons_au AFTER UPDATE ON denied_persons BEGIN
+DROP TRIGGER IF EXISTS denied_persons_au;
+CREATE TRIGGER denied_persons_au AFTER UPDATE ON denied_persons
+WHEN old.name IS NOT new.name BEGIN
     INSERT INTO denied_persons_fts(denied_persons_fts, rowid, name)
     VALUES('delete', old.rowid, old.name);
     INSERT INTO denied_persons_fts(rowid, name) VALUES (new.rowid, new.name);
@@ -175,7 +262,9 @@ CREATE TRIGGER IF NOT EXISTS csl_ad AFTER DELETE ON csl BEGIN
     INSERT INTO csl_fts(csl_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
 END;
-CREATE TRIGGER IF NOT EXISTS csl_au AFTER UPDATE ON csl BEGIN
+DROP TRIGGER IF EXISTS csl_au;
+CREATE TRIGGER csl_au AFTER UPDATE ON csl
+WHEN old.name IS NOT new.name OR old.aliases IS NOT new.aliases BEGIN
     INSERT INTO csl_fts(csl_fts, rowid, name, aliases)
     VALUES('delete', old.rowid, old.name, old.aliases);
     INSERT INTO csl_fts(rowid, name, aliases) VALUES (new.rowid, new.name, new.aliases);
@@ -183,6 +272,182 @@ END;
 """
 
 
+# =============================================================================
+# Upsert Statements (named placeholders bound from per-table row builders)
+# =============================================================================
+
+_ENTITY_LIST_COLS = (
+    "name",
+    "aliases",
+    "addresses",
+    "country",
+    "license_requirement",
+    "license_policy",
+    "federal_register_citation",
+    "effective_date",
+    "standard_order",
+)
+_SDN_LIST_COLS = (
+    "name",
+    "sdn_type",
+    "programs",
+    "aliases",
+    "addresses",
+    "ids",
+    "nationalities",
+    "dates_of_birth",
+    "places_of_birth",
+    "remarks",
+)
+_DENIED_PERSONS_COLS = (
+    "name",
+    "addresses",
+    "effective_date",
+    "expiration_date",
+    "standard_order",
+    "federal_register_citation",
+)
+_COUNTRY_SANCTIONS_COLS = (
+    "country_name",
+    "ofac_programs",
+    "embargo_type",
+    "ear_country_groups",
+    "itar_restricted",
+    "arms_embargo",
+    "summary",
+    "key_restrictions",
+    "notes",
+)
+_CSL_COLS = (
+    "name",
+    "entry_type",
+    "source_list",
+    "programs",
+    "aliases",
+    "addresses",
+    "countries",
+    "remarks",
+)
+
+
+def _build_upsert(table: str, key: str, columns: tuple[str, ...]) -> str:
+    """Build an upsert that only writes when a column value actually changed.
+
+    Re-inserting an unchanged entry (the common case during a list refresh)
+    is a no-op, so no row is rewritten and the FTS triggers never fire.
+    """
+    names = (key, *columns)
+    assignments = ", ".join(f"{col} = excluded.{col}" for col in columns)
+    changed = " OR ".join(f"{table}.{col} IS NOT excluded.{col}" for col in columns)
+    return (
+        f"INSERT INTO {table} ({', '.join(names)}) "  # noqa: S608  # nosec B608
+        f"VALUES ({', '.join(':' + col for col in names)}) "
+        f"ON CONFLICT({key}) DO UPDATE SET {assignments} WHERE {changed}"
+    )
+
+
+# Table and column names are module constants - safe for SQL interpolation
+_INSERT_ENTITY_LIST = _build_upsert("entity_list", "id", _ENTITY_LIST_COLS)
+_INSERT_SDN_LIST = _build_upsert("sdn_list", "id", _SDN_LIST_COLS)
+_INSERT_DENIED_PERSONS = _build_upsert("denied_persons", "id", _DENIED_PERSONS_COLS)
+_INSERT_COUNTRY_SANCTIONS = _build_upsert(
+    "country_sanctions", "country_code", _COUNTRY_SANCTIONS_COLS
+)
+_INSERT_CSL = _build_upsert("csl", "id", _CSL_COLS)
+
+# JSON-encoded list columns per table; every other column binds straight from the model
+_ENTITY_LIST_JSON_COLS = ("aliases", "addresses")
+_SDN_LIST_JSON_COLS = (
+    "programs",
+    "aliases",
+    "addresses",
+    "ids",
+    "nationalities",
+    "dates_of_birth",
+    "places_of_birth",
+)
+_COUNTRY_SANCTIONS_JSON_COLS = ("ofac_programs", "ear_country_groups", "key_restrictions", "notes")
+
+
+def _model_row(model: BaseModel, json_cols: tuple[str, ...]) -> dict[str, Any]:
+    """Build named-parameter bindings from a model's field dict.
+
+    Reads the pydantic instance ``__dict__`` directly (one dict lookup per
+    column instead of a descriptor call) and JSON-encodes list columns.
+    Extra keys are ignored by sqlite3 when binding named parameters.
+    """
+    row = dict(model.__dict__)
+    for col in json_cols:
+        row[col] = json.dumps(row[col])
+    return row
+
+
+@dataclass
+class _FuzzyMatch:
+    """A fuzzy fallback hit, recorded before its full row is fetched."""
+
+    rowid: int
+    score: float
+    match_type: str
+    matched_field: str
+    matched_value: str
+
+    def to_search_result(
+        self, entry: EntityListEntry | SDNEntry | DeniedPersonEntry
+    ) -> SanctionsSearchResult:
+        """Wrap the fetched entry as a search result."""
+        return SanctionsSearchResult(
+            entry=entry,
+            match_score=self.score,
+            match_type=self.match_type,
+            matched_field=self.matched_field,
+            matched_value=self.matched_value,
+        )
+
+
+def _ratio_scores(query: str, choices: list[str], fuzzy_threshold: float) -> list[float]:
+    """Score every choice against the query with one batched rapidfuzz call.
+
+    cdist lowercases and scores in C, building the query's bit-parallel
+    pattern once. It runs single-threaded: concurrent searches already run
+    on the search pool's workers, and fanning each one out across every
+    core would oversubscribe the CPU. Scores are returned on the 0-1 scale;
+    those below ``fuzzy_threshold`` come back as 0.
+    """
+    scores = process.cdist(
+        [query],
+        choices,
+        scorer=fuzz.ratio,
+        processor=str.lower,
+        score_cutoff=fuzzy_threshold * 100,
+        dtype=np.float64,
+        workers=1,
+    )[0]
+    similarities: list[float] = (scores / 100.0).tolist()
+    return similarities
+
+
+def _name_length_bounds(query: str, fuzzy_threshold: float) -> tuple[int, int]:
+    """Return the lowercased name lengths that can still reach ``fuzzy_threshold``.
+
+    fuzz.ratio is at most 2 * min(len) / (sum of lengths), so names much
+    shorter or longer than the query are rejected on length alone. Compare
+    against ``_LOWER_NAME_LENGTH``.
+    """
+    if fuzzy_threshold <= 0:
+        return 0, sys.maxsize
+    query_len = len(query.lower())
+    threshold = min(fuzzy_threshold, 1.0)
+    shortest = math.floor(threshold * query_len / (2 - threshold))
+    longest = math.ceil(query_len * (2 - threshold) / threshold)
+    return shortest, longest
+
+
+def _iso_or_none(value: date | None) -> str | None:
+    """Format an optional date for storage."""
+    return value.isoformat() if value else None
+
+
 class SanctionsDBService:
     """SQLite database service for sanctions list queries.
 
@@ -193,8 +458,10 @@ class SanctionsDBService:
     - FTS5 handles most queries without needing fuzzy fallback
     - Fuzzy matching uses rapidfuzz (C implementation), which is already highly optimized
     - Dataset sizes are bounded (sanctions lists are typically <50K entries)
-    - Async executor was evaluated but not needed: rapidfuzz operations complete
-      in microseconds, and executor overhead would exceed the matching time
+    - The fuzzy fallback scans whole tables, so the ``asearch_*`` variants run
+      searches on a dedicated thread pool to keep the event loop responsive.
+      Each worker thread reads through its own connection; rapidfuzz releases
+      the GIL, so concurrent searches scale across workers.
     """
 
     def __init__(self, db_path: str | Path | None = None):
@@ -207,17 +474,101 @@ class SanctionsDBService:
         self._db_path = Path(db_path) if db_path else Path(settings.sanctions_db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: sqlite3.Connection | None = None
+        self._search_workers = max(1, settings.sanctions_search_workers)
+        self._search_pool: ThreadPoolExecutor | None = None
+        self._local = threading.local()
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+        self._in_bulk_write = False
         self._initialize_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the standard row factory and pragmas."""
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets pool readers keep searching while the write connection commits
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn = self._connect()
         return self._conn
 
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless writes are being grouped by bulk_write()."""
+        if not self._in_bulk_write:
+            conn.commit()
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into a single transaction.
+
+        Meant for resets and bulk ingestion. Writes made inside the block
+        are committed together on exit and rolled back if it raises. The
+        connection keeps synchronous=NORMAL: under WAL one transaction
+        already avoids a sync per write, and a crash mid-ingest leaves the
+        database intact rather than needing it deleted.
+
+        Yields:
+            The write connection.
+        """
+        conn = self._get_connection()
+        if self._in_bulk_write:
+            yield conn
+            return
+
+        # Pragmas cannot change inside a transaction, so close any open one
+        conn.commit()
+        saved_temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        conn.execute("PRAGMA temp_store = MEMORY")
+        try:
+            # Restore temp_store below even if the write lock is unavailable
+            conn.execute("BEGIN IMMEDIATE")
+            self._in_bulk_write = True
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+        finally:
+            self._in_bulk_write = False
+            conn.execute(f"PRAGMA temp_store = {int(saved_temp_store)}")
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's read connection, creating it on first use.
+
+        Searches run on the search pool's worker threads, so each worker is
+        bound to one connection instead of sharing the write connection.
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+        return conn
+
+    async def _run_search(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking search on the search thread pool."""
+        if self._search_pool is None:
+            self._search_pool = ThreadPoolExecutor(
+                max_workers=self._search_workers,
+                thread_name_prefix="sanctions-search",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._search_pool, partial(func, *args, **kwargs))
+
     def _initialize_db(self) -> None:
         """Create database schema if not exists.
 
@@ -235,41 +586,115 @@ class SanctionsDBService:
         conn.execute(_SCHEMA_COUNTRY_SANCTIONS)
         conn.execute(_SCHEMA_CSL)
         conn.execute(_SCHEMA_CSL_FTS)
+        conn.execute(_SCHEMA_CSL_COUNTRIES)
+        conn.executescript(_INDEX_CSL_COUNTRIES)
 
         # Create FTS sync triggers
         conn.executescript(_TRIGGERS_ENTITY_LIST)
         conn.executescript(_TRIGGERS_SDN_LIST)
         conn.executescript(_TRIGGERS_DENIED_PERSONS)
         conn.executescript(_TRIGGERS_CSL)
+        conn.executescript(_TRIGGERS_CSL_COUNTRIES)
+        conn.executescript(_DROP_CSL_TRIGRAM)
+
+        # Migrate existing CSL data into csl_countries
+        conn.execute(_BACKFILL_CSL_COUNTRIES)
 
         conn.commit()
 
+    # --- Fuzzy Fallback Helpers ---
+
+    def _score_fuzzy_candidates(
+        self,
+        rows: Iterable[sqlite3.Row],
+        query: str,
+        fuzzy_threshold: float,
+        seen_ids: set[str],
+        limit: int,
+        check_aliases: bool = True,
+    ) -> list[_FuzzyMatch]:
+        """Score projected candidate rows against the query.
+
+        Rows only need ``rowid``, ``id``, ``name`` and (when ``check_aliases``)
+        ``aliases``, so the fallback scan never materializes the wide columns
+        of rows that end up rejected.
+
+        Args:
+            rows: Projected candidate rows
+            query: Search query
+            fuzzy_threshold: Minimum fuzzy match score (0-1)
+            seen_ids: IDs already matched by FTS, skipped here
+            limit: Maximum matches to keep
+            check_aliases: Whether to fall back to alias matching
+
+        Returns:
+            Up to ``limit`` matches, best score first
+        """
+        candidates = [row for row in rows if row["id"] not in seen_ids]
+        if not candidates:
+            return []
+
+        matches: list[_FuzzyMatch] = []
+        alias_texts: list[str] = []
+        alias_owners: list[int] = []
+
+        # Check names, queueing aliases of rows whose name missed
+        names = [row["name"] for row in candidates]
+        name_scores = _ratio_scores(query, names, fuzzy_threshold)
+        for index, (row, score) in enumerate(zip(candidates, name_scores, strict=True)):
+            if score >= fuzzy_threshold:
+                matches.append(_FuzzyMatch(row["rowid"], score, "fuzzy_name", "name", row["name"]))
+            elif check_aliases and row["aliases"]:
+                for alias in orjson.loads(row["aliases"]):
+                    alias_texts.append(alias)
+                    alias_owners.append(index)
+
+        # Check aliases, keeping each row's best-scoring alias
+        if alias_texts:
+            best_alias: dict[int, tuple[float, str]] = {}
+            alias_scores = _ratio_scores(query, alias_texts, fuzzy_threshold)
+            for owner, alias, score in zip(alias_owners, alias_texts, alias_scores, strict=True):
+                if score >= fuzzy_threshold and score > best_alias.get(owner, (-1.0, ""))[0]:
+                    best_alias[owner] = (score, alias)
+            for owner, (score, alias) in best_alias.items():
+                rowid = candidates[owner]["rowid"]
+                matches.append(_FuzzyMatch(rowid, score, "alias", "alias", alias))
+
+        # Only the best `limit` fuzzy matches can survive the final merge
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+    def _fetch_rows_by_rowid(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        matches: list[_FuzzyMatch],
+    ) -> dict[int, sqlite3.Row]:
+        """Fetch full rows for fuzzy survivors, keyed by rowid."""
+        if table not in _VALID_TABLES:
+            raise ValueError(f"Invalid table name: {table}")
+        if not matches:
+            return {}
+
+        # Rowids bind as one JSON array so the SQL text (and its cached
+        # prepared statement) is the same no matter how many rows survive
+        rowids = json.dumps([m.rowid for m in matches])
+        # Table name validated against allowlist - safe for SQL interpolation
+        cursor = conn.execute(
+            f"SELECT rowid, * FROM {table} WHERE rowid IN (SELECT value FROM json_each(?))",  # noqa: S608  # nosec B608
+            (rowids,),
+        )
+        return {row["rowid"]: row for row in cursor}
+
     # --- Entity List Operations ---
 
     def add_entity_list_entry(self, entry: EntityListEntry) -> None:
         """Add an entry to the Entity List."""
         conn = self._get_connection()
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO entity_list
-            (id, name, aliases, addresses, country, license_requirement,
-             license_policy, federal_register_citation, effective_date, standard_order)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.id,
-                entry.name,
-                json.dumps(entry.aliases),
-                json.dumps(entry.addresses),
-                entry.country,
-                entry.license_requirement,
-                entry.license_policy,
-                entry.federal_register_citation,
-                entry.effective_date.isoformat() if entry.effective_date else None,
-                entry.standard_order,
-            ),
-        )
-        conn.commit()
+        row = _model_row(entry, _ENTITY_LIST_JSON_COLS)
+        row["effective_date"] = _iso_or_none(entry.effective_date)
+        conn.execute(_INSERT_ENTITY_LIST, row)
+        self._commit(conn)
 
     def search_entity_list(
         self,
@@ -289,7 +714,7 @@ class SanctionsDBService:
         Returns:
             List of search results with match scores
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         results = []
 
         # First try exact FTS5 match
@@ -324,9 +749,9 @@ class SanctionsDBService:
                 )
             )
 
-        # If not enough results, do fuzzy search on all entries
+        # If not enough results, fuzzy-score a narrow projection of all entries
         if len(results) < limit:
-            sql = "SELECT * FROM entity_list"
+            sql = "SELECT rowid, id, name, aliases FROM entity_list"
             params = []
             if country:
                 sql += " WHERE country = ?"
@@ -334,53 +759,39 @@ class SanctionsDBService:
 
             cursor = conn.execute(sql, params)
             seen_ids = {r.entry.id for r in results}
+            matches = self._score_fuzzy_candidates(cursor, query, fuzzy_threshold, seen_ids, limit)
+            full_rows = self._fetch_rows_by_rowid(conn, "entity_list", matches)
 
-            for row in cursor:
-                if row["id"] in seen_ids:
-                    continue
-
-                entry = self._row_to_entity_list_entry(row)
-
-                # Check name
-                name_score = fuzz.ratio(query.lower(), entry.name.lower()) / 100.0
-                if name_score >= fuzzy_threshold:
-                    results.append(
-                        SanctionsSearchResult(
-                            entry=entry,
-                            match_score=name_score,
-                            match_type="fuzzy_name",
-                            matched_field="name",
-                            matched_value=entry.name,
-                        )
-                    )
-                    continue
-
-                # Check aliases
-                for alias in entry.aliases:
-                    alias_score = fuzz.ratio(query.lower(), alias.lower()) / 100.0
-                    if alias_score >= fuzzy_threshold:
-                        results.append(
-                            SanctionsSearchResult(
-                                entry=entry,
-                                match_score=alias_score,
-                                match_type="alias",
-                                matched_field="alias",
-                                matched_value=alias,
-                            )
-                        )
-                        break
+            for match in matches:
+                entry = self._row_to_entity_list_entry(full_rows[match.rowid])
+                results.append(match.to_search_result(entry))
 
         # Sort by score and limit
         results.sort(key=lambda r: r.match_score, reverse=True)
         return results[:limit]
 
+    async def asearch_entity_list(
+        self,
+        query: str,
+        country: str | None = None,
+        fuzzy_threshold: float = 0.7,
+        limit: int = 20,
+    ) -> list[SanctionsSearchResult]:
+        """Search the BIS Entity List without blocking the event loop.
+
+        See :meth:`search_entity_list` for arguments.
+        """
+        return await self._run_search(
+            self.search_entity_list, query, country, fuzzy_threshold, limit
+        )
+
     def _row_to_entity_list_entry(self, row: sqlite3.Row) -> EntityListEntry:
         """Convert database row to EntityListEntry."""
         return EntityListEntry(
             id=row["id"],
             name=row["name"],
-            aliases=json.loads(row["aliases"]),
-            addresses=json.loads(row["addresses"]),
+            aliases=orjson.loads(row["aliases"]),
+            addresses=orjson.loads(row["addresses"]),
             country=row["country"],
             license_requirement=row["license_requirement"],
             license_policy=row["license_policy"],
@@ -396,28 +807,10 @@ class SanctionsDBService:
     def add_sdn_entry(self, entry: SDNEntry) -> None:
         """Add an entry to the SDN List."""
         conn = self._get_connection()
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO sdn_list
-            (id, name, sdn_type, programs, aliases, addresses, ids,
-             nationalities, dates_of_birth, places_of_birth, remarks)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.id,
-                entry.name,
-                entry.sdn_type.value,
-                json.dumps(entry.programs),
-                json.dumps(entry.aliases),
-                json.dumps(entry.addresses),
-                json.dumps(entry.ids),
-                json.dumps(entry.nationalities),
-                json.dumps(entry.dates_of_birth),
-                json.dumps(entry.places_of_birth),
-                entry.remarks,
-            ),
-        )
-        conn.commit()
+        row = _model_row(entry, _SDN_LIST_JSON_COLS)
+        row["sdn_type"] = entry.sdn_type.value
+        conn.execute(_INSERT_SDN_LIST, row)
+        self._commit(conn)
 
     def search_sdn_list(
         self,
@@ -439,7 +832,7 @@ class SanctionsDBService:
         Returns:
             List of search results with match scores
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         results = []
 
         # First try exact FTS5 match
@@ -477,7 +870,7 @@ class SanctionsDBService:
 
         # Fuzzy search if needed
         if len(results) < limit:
-            sql = "SELECT * FROM sdn_list"
+            sql = "SELECT rowid, id, name, aliases FROM sdn_list"
             conditions = []
             params = []
 
@@ -485,63 +878,55 @@ class SanctionsDBService:
                 conditions.append("sdn_type = ?")
                 params.append(sdn_type.value)
 
+            if program:
+                # Filter in SQLite so rows outside the program are never decoded
+                conditions.append("EXISTS (SELECT 1 FROM json_each(programs) WHERE value = ?)")
+                params.append(program)
+
             if conditions:
                 sql += " WHERE " + " AND ".join(conditions)
 
             cursor = conn.execute(sql, params)
             seen_ids = {r.entry.id for r in results}
+            matches = self._score_fuzzy_candidates(cursor, query, fuzzy_threshold, seen_ids, limit)
+            full_rows = self._fetch_rows_by_rowid(conn, "sdn_list", matches)
 
-            for row in cursor:
-                if row["id"] in seen_ids:
-                    continue
-
-                entry = self._row_to_sdn_entry(row)
-                if program and program not in entry.programs:
-                    continue
-
-                name_score = fuzz.ratio(query.lower(), entry.name.lower()) / 100.0
-                if name_score >= fuzzy_threshold:
-                    results.append(
-                        SanctionsSearchResult(
-                            entry=entry,
-                            match_score=name_score,
-                            match_type="fuzzy_name",
-                            matched_field="name",
-                            matched_value=entry.name,
-                        )
-                    )
-                    continue
-
-                for alias in entry.aliases:
-                    alias_score = fuzz.ratio(query.lower(), alias.lower()) / 100.0
-                    if alias_score >= fuzzy_threshold:
-                        results.append(
-                            SanctionsSearchResult(
-                                entry=entry,
-                                match_score=alias_score,
-                                match_type="alias",
-                                matched_field="alias",
-                                matched_value=alias,
-                            )
-                        )
-                        break
+            for match in matches:
+                entry = self._row_to_sdn_entry(full_rows[match.rowid])
+                results.append(match.to_search_result(entry))
 
         results.sort(key=lambda r: r.match_score, reverse=True)
         return results[:limit]
 
+    async def asearch_sdn_list(
+        self,
+        query: str,
+        sdn_type: EntityType | None = None,
+        program: str | None = None,
+        fuzzy_threshold: float = 0.7,
+        limit: int = 20,
+    ) -> list[SanctionsSearchResult]:
+        """Search the OFAC SDN List without blocking the event loop.
+
+        See :meth:`search_sdn_list` for arguments.
+        """
+        return await self._run_search(
+            self.search_sdn_list, query, sdn_type, program, fuzzy_threshold, limit
+        )
+
     def _row_to_sdn_entry(self, row: sqlite3.Row) -> SDNEntry:
         """Convert database row to SDNEntry."""
         return SDNEntry(
             id=row["id"],
             name=row["name"],
             sdn_type=EntityType(row["sdn_type"]),
-            programs=json.loads(row["programs"]),
-            aliases=json.loads(row["aliases"]),
-            addresses=json.loads(row["addresses"]),
-            ids=json.loads(row["ids"]),
-            nationalities=json.loads(row["nationalities"]),
-            dates_of_birth=json.loads(row["dates_of_birth"]),
-            places_of_birth=json.loads(row["places_of_birth"]),
+            programs=orjson.loads(row["programs"]),
+            aliases=orjson.loads(row["aliases"]),
+            addresses=orjson.loads(row["addresses"]),
+            ids=orjson.loads(row["ids"]),
+            nationalities=orjson.loads(row["nationalities"]),
+            dates_of_birth=orjson.loads(row["dates_of_birth"]),
+            places_of_birth=orjson.loads(row["places_of_birth"]),
             remarks=row["remarks"],
         )
 
@@ -550,24 +935,11 @@ class SanctionsDBService:
     def add_denied_person(self, entry: DeniedPersonEntry) -> None:
         """Add an entry to the Denied Persons List."""
         conn = self._get_connection()
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO denied_persons
-            (id, name, addresses, effective_date, expiration_date,
-             standard_order, federal_register_citation)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.id,
-                entry.name,
-                json.dumps(entry.addresses),
-                entry.effective_date.isoformat() if entry.effective_date else None,
-                entry.expiration_date.isoformat() if entry.expiration_date else None,
-                entry.standard_order,
-                entry.federal_register_citation,
-            ),
-        )
-        conn.commit()
+        row = _model_row(entry, ("addresses",))
+        row["effective_date"] = _iso_or_none(entry.effective_date)
+        row["expiration_date"] = _iso_or_none(entry.expiration_date)
+        conn.execute(_INSERT_DENIED_PERSONS, row)
+        self._commit(conn)
 
     def search_denied_persons(
         self,
@@ -585,7 +957,7 @@ class SanctionsDBService:
         Returns:
             List of search results with match scores
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         results = []
 
         # FTS5 search
@@ -616,35 +988,43 @@ class SanctionsDBService:
 
         # Fuzzy search
         if len(results) < limit:
-            cursor = conn.execute("SELECT * FROM denied_persons")
+            # No aliases to check, so rule out names on length in SQL
+            cursor = conn.execute(
+                "SELECT rowid, id, name FROM denied_persons"  # noqa: S608  # nosec B608
+                f" WHERE {_LOWER_NAME_LENGTH} BETWEEN ? AND ?",
+                _name_length_bounds(query, fuzzy_threshold),
+            )
             seen_ids = {r.entry.id for r in results}
+            matches = self._score_fuzzy_candidates(
+                cursor, query, fuzzy_threshold, seen_ids, limit, check_aliases=False
+            )
+            full_rows = self._fetch_rows_by_rowid(conn, "denied_persons", matches)
 
-            for row in cursor:
-                if row["id"] in seen_ids:
-                    continue
-
-                entry = self._row_to_denied_person_entry(row)
-                score = fuzz.ratio(query.lower(), entry.name.lower()) / 100.0
-                if score >= fuzzy_threshold:
-                    results.append(
-                        SanctionsSearchResult(
-                            entry=entry,
-                            match_score=score,
-                            match_type="fuzzy_name",
-                            matched_field="name",
-                            matched_value=entry.name,
-                        )
-                    )
+            for match in matches:
+                entry = self._row_to_denied_person_entry(full_rows[match.rowid])
+                results.append(match.to_search_result(entry))
 
         results.sort(key=lambda r: r.match_score, reverse=True)
         return results[:limit]
 
+    async def asearch_denied_persons(
+        self,
+        query: str,
+        fuzzy_threshold: float = 0.7,
+        limit: int = 20,
+    ) -> list[SanctionsSearchResult]:
+        """Search the BIS Denied Persons List without blocking the event loop.
+
+        See :meth:`search_denied_persons` for arguments.
+        """
+        return await self._run_search(self.search_denied_persons, query, fuzzy_threshold, limit)
+
     def _row_to_denied_person_entry(self, row: sqlite3.Row) -> DeniedPersonEntry:
         """Convert database row to DeniedPersonEntry."""
         return DeniedPersonEntry(
             id=row["id"],
             name=row["name"],
-            addresses=json.loads(row["addresses"]),
+            addresses=orjson.loads(row["addresses"]),
             effective_date=date.fromisoformat(row["effective_date"])
             if row["effective_date"]
             else None,
@@ -660,28 +1040,11 @@ class SanctionsDBService:
     def add_country_sanctions(self, sanctions: CountrySanctions) -> None:
         """Add or update country sanctions data."""
         conn = self._get_connection()
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO country_sanctions
-            (country_code, country_name, ofac_programs, embargo_type,
-             ear_country_groups, itar_restricted, arms_embargo, summary,
-             key_restrictions, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                sanctions.country_code,
-                sanctions.country_name,
-                json.dumps(sanctions.ofac_programs),
-                sanctions.embargo_type,
-                json.dumps(sanctions.ear_country_groups),
-                1 if sanctions.itar_restricted else 0,
-                1 if sanctions.arms_embargo else 0,
-                sanctions.summary,
-                json.dumps(sanctions.key_restrictions),
-                json.dumps(sanctions.notes),
-            ),
-        )
-        conn.commit()
+        row = _model_row(sanctions, _COUNTRY_SANCTIONS_JSON_COLS)
+        row["itar_restricted"] = 1 if sanctions.itar_restricted else 0
+        row["arms_embargo"] = 1 if sanctions.arms_embargo else 0
+        conn.execute(_INSERT_COUNTRY_SANCTIONS, row)
+        self._commit(conn)
 
     def get_country_sanctions(self, country_code: str) -> CountrySanctions | None:
         """Get sanctions information for a country.
@@ -692,7 +1055,7 @@ class SanctionsDBService:
         Returns:
             CountrySanctions object or None if not found
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         cursor = conn.execute(
             "SELECT * FROM country_sanctions WHERE country_code = ?",
             (country_code.upper(),),
@@ -704,14 +1067,14 @@ class SanctionsDBService:
         return CountrySanctions(
             country_code=row["country_code"],
             country_name=row["country_name"],
-            ofac_programs=json.loads(row["ofac_programs"]),
+            ofac_programs=orjson.loads(row["ofac_programs"]),
             embargo_type=row["embargo_type"],
-            ear_country_groups=json.loads(row["ear_country_groups"]),
+            ear_country_groups=orjson.loads(row["ear_country_groups"]),
             itar_restricted=bool(row["itar_restricted"]),
             arms_embargo=bool(row["arms_embargo"]),
             summary=row["summary"],
-            key_restrictions=json.loads(row["key_restrictions"]),
-            notes=json.loads(row["notes"]),
+            key_restrictions=orjson.loads(row["key_restrictions"]),
+            notes=orjson.loads(row["notes"]),
         )
 
     def get_country_by_name(self, country_name: str) -> CountrySanctions | None:
@@ -723,7 +1086,7 @@ class SanctionsDBService:
         Returns:
             CountrySanctions object or None if not found
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         # Try exact match first
         cursor = conn.execute(
             "SELECT * FROM country_sanctions WHERE LOWER(country_name) = LOWER(?)",
@@ -745,32 +1108,50 @@ class SanctionsDBService:
         return CountrySanctions(
             country_code=row["country_code"],
             country_name=row["country_name"],
-            ofac_programs=json.loads(row["ofac_programs"]),
+            ofac_programs=orjson.loads(row["ofac_programs"]),
             embargo_type=row["embargo_type"],
-            ear_country_groups=json.loads(row["ear_country_groups"]),
+            ear_country_groups=orjson.loads(row["ear_country_groups"]),
             itar_restricted=bool(row["itar_restricted"]),
             arms_embargo=bool(row["arms_embargo"]),
             summary=row["summary"],
-            key_restrictions=json.loads(row["key_restrictions"]),
-            notes=json.loads(row["notes"]),
+            key_restrictions=orjson.loads(row["key_restrictions"]),
+            notes=orjson.loads(row["notes"]),
         )
 
     # --- CSL Operations ---
 
-    def _matches_country_filter(self, row: sqlite3.Row, country: str | None) -> bool:
-        """Check if a CSL row matches the country filter.
+    def _csl_filters(
+        self,
+        source_list: str | None,
+        country: str | None,
+    ) -> tuple[list[str], list[Any]]:
+        """Build SQL conditions for the CSL source list and country filters.
+
+        Conditions reference the CSL table as ``c``. The country match runs
+        against the indexed ``csl_countries`` table (case-insensitive).
 
         Args:
-            row: Database row with 'countries' JSON field
-            country: Optional country code filter (case-insensitive)
+            source_list: Optional source list filter
+            country: Optional country filter
 
         Returns:
-            True if no filter specified or row matches filter
+            Tuple of (SQL conditions, bound parameters)
         """
-        if not country:
-            return True
-        countries_list = json.loads(row["countries"]) if row["countries"] else []
-        return country.upper() in [c.upper() for c in countries_list]
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if source_list:
+            conditions.append("c.source_list = ?")
+            params.append(source_list)
+
+        if country:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM csl_countries cc"
+                " WHERE cc.country = ? AND cc.csl_rowid = c.rowid)"
+            )
+            params.append(country)
+
+        return conditions, params
 
     def _search_csl_fts(
         self,
@@ -790,7 +1171,7 @@ class SanctionsDBService:
         Returns:
             Tuple of (results list, set of seen IDs)
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         results: list[dict[str, Any]] = []
         seen_ids: set[str] = set()
 
@@ -803,9 +1184,10 @@ class SanctionsDBService:
         """
         params: list[Any] = [f'"{fts_query}"']
 
-        if source_list:
-            sql += " AND c.source_list = ?"
-            params.append(source_list)
+        conditions, filter_params = self._csl_filters(source_list, country)
+        for condition in conditions:
+            sql += f" AND {condition}"
+        params.extend(filter_params)
 
         sql += " ORDER BY rank LIMIT ?"
         params.append(limit * 2)
@@ -813,9 +1195,6 @@ class SanctionsDBService:
         cursor = conn.execute(sql, params)
 
         for row in cursor:
-            if not self._matches_country_filter(row, country):
-                continue
-
             entry = self._row_to_csl_dict(row)
             score = fuzz.ratio(query.lower(), row["name"].lower()) / 100.0
             entry["match_score"] = score
@@ -832,6 +1211,7 @@ class SanctionsDBService:
         country: str | None,
         fuzzy_threshold: float,
         seen_ids: set[str],
+        limit: int,
     ) -> list[dict[str, Any]]:
         """Perform fuzzy search on CSL table for entries not found via FTS.
 
@@ -841,51 +1221,32 @@ class SanctionsDBService:
             country: Optional country filter
             fuzzy_threshold: Minimum fuzzy match score (0-1)
             seen_ids: Set of IDs already matched by FTS
+            limit: Maximum results
 
         Returns:
             List of fuzzy-matched results
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         results = []
 
-        sql = "SELECT * FROM csl"
-        params = []
+        conditions, params = self._csl_filters(source_list, country)
 
-        if source_list:
-            sql += " WHERE source_list = ?"
-            params.append(source_list)
+        sql = "SELECT c.rowid, c.id, c.name, c.aliases FROM csl c"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
 
         cursor = conn.execute(sql, params)
-
-        for row in cursor:
-            if row["id"] in seen_ids:
-                continue
-
-            if not self._matches_country_filter(row, country):
-                continue
-
-            # Check name match
-            name_score = fuzz.ratio(query.lower(), row["name"].lower()) / 100.0
-            if name_score >= fuzzy_threshold:
-                entry = self._row_to_csl_dict(row)
-                entry["match_score"] = name_score
-                entry["match_type"] = "fuzzy_name"
-                results.append(entry)
-                seen_ids.add(row["id"])
-                continue
-
-            # Check alias match
-            aliases = json.loads(row["aliases"]) if row["aliases"] else []
-            for alias in aliases:
-                alias_score = fuzz.ratio(query.lower(), alias.lower()) / 100.0
-                if alias_score >= fuzzy_threshold:
-                    entry = self._row_to_csl_dict(row)
-                    entry["match_score"] = alias_score
-                    entry["match_type"] = "alias"
-                    entry["matched_alias"] = alias
-                    results.append(entry)
-                    seen_ids.add(row["id"])
-                    break
+        matches = self._score_fuzzy_candidates(cursor, query, fuzzy_threshold, seen_ids, limit)
+        full_rows = self._fetch_rows_by_rowid(conn, "csl", matches)
+
+        for match in matches:
+            entry = self._row_to_csl_dict(full_rows[match.rowid])
+            entry["match_score"] = match.score
+            entry["match_type"] = match.match_type
+            if match.matched_field == "alias":
+                entry["matched_alias"] = match.matched_value
+            results.append(entry)
+            seen_ids.add(entry["id"])
 
         return results
 
@@ -904,24 +1265,20 @@ class SanctionsDBService:
         """Add an entry to the Consolidated Screening List."""
         conn = self._get_connection()
         conn.execute(
-            """
-            INSERT OR REPLACE INTO csl
-            (id, name, entry_type, source_list, programs, aliases, addresses, countries, remarks)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry_id,
-                name,
-                entry_type,
-                source_list,
-                json.dumps(programs or []),
-                json.dumps(aliases or []),
-                json.dumps(addresses or []),
-                json.dumps(countries or []),
-                remarks,
-            ),
+            _INSERT_CSL,
+            {
+                "id": entry_id,
+                "name": name,
+                "entry_type": entry_type,
+                "source_list": source_list,
+                "programs": json.dumps(programs or []),
+                "aliases": json.dumps(aliases or []),
+                "addresses": json.dumps(addresses or []),
+                "countries": json.dumps(countries or []),
+                "remarks": remarks,
+            },
         )
-        conn.commit()
+        self._commit(conn)
 
     def search_csl(
         self,
@@ -952,7 +1309,7 @@ class SanctionsDBService:
         # Phase 2: Fuzzy search if needed
         if len(results) < limit:
             fuzzy_results = self._search_csl_fuzzy(
-                query, source_list, country, fuzzy_threshold, seen_ids
+                query, source_list, country, fuzzy_threshold, seen_ids, limit
             )
             results.extend(fuzzy_results)
 
@@ -960,6 +1317,22 @@ class SanctionsDBService:
         results.sort(key=lambda r: r.get("match_score", 0), reverse=True)
         return results[:limit]
 
+    async def asearch_csl(
+        self,
+        query: str,
+        source_list: str | None = None,
+        country: str | None = None,
+        fuzzy_threshold: float = 0.7,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Search the Consolidated Screening List without blocking the event loop.
+
+        See :meth:`search_csl` for arguments.
+        """
+        return await self._run_search(
+            self.search_csl, query, source_list, country, fuzzy_threshold, limit
+        )
+
     def _row_to_csl_dict(self, row: sqlite3.Row) -> dict[str, Any]:
         """Convert database row to CSL dictionary."""
         return {
@@ -967,22 +1340,21 @@ class SanctionsDBService:
             "name": row["name"],
             "entry_type": row["entry_type"],
             "source_list": row["source_list"],
-            "programs": json.loads(row["programs"]) if row["programs"] else [],
-            "aliases": json.loads(row["aliases"]) if row["aliases"] else [],
-            "addresses": json.loads(row["addresses"]) if row["addresses"] else [],
-            "countries": json.loads(row["countries"]) if row["countries"] else [],
+            "programs": orjson.loads(row["programs"]) if row["programs"] else [],
+            "aliases": orjson.loads(row["aliases"]) if row["aliases"] else [],
+            "addresses": orjson.loads(row["addresses"]) if row["addresses"] else [],
+            "countries": orjson.loads(row["countries"]) if row["countries"] else [],
             "remarks": row["remarks"],
         }
 
     def clear_csl(self) -> None:
         """Clear all CSL data."""
-        conn = self._get_connection()
-        conn.execute("DELETE FROM csl")
-        conn.commit()
+        with self.bulk_write() as conn:
+            conn.execute("DELETE FROM csl")
 
     def get_csl_stats(self) -> dict[str, int]:
         """Get CSL statistics by source list."""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         cursor = conn.execute("""
             SELECT source_list, COUNT(*) as count
             FROM csl
@@ -995,30 +1367,25 @@ class SanctionsDBService:
 
     def clear_all(self) -> None:
         """Clear all data from all tables."""
-        conn = self._get_connection()
-        conn.executescript("""
-            DELETE FROM entity_list;
-            DELETE FROM sdn_list;
-            DELETE FROM denied_persons;
-            DELETE FROM country_sanctions;
-            DELETE FROM csl;
-        """)
-        conn.commit()
+        with self.bulk_write() as conn:
+            for table in sorted(_VALID_TABLES):
+                conn.execute(f"DELETE FROM {table}")  # noqa: S608  # nosec B608
 
     def get_stats(self) -> dict[str, Any]:
         """Get database statistics."""
-        conn = self._get_connection()
-        stats = {}
-
-        for table in _VALID_TABLES:
-            # Table name validated against allowlist - safe for SQL interpolation
-            cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")  # noqa: S608  # nosec B608
-            stats[table] = cursor.fetchone()[0]
-
-        return stats
+        conn = self._get_read_connection()
+        return dict(conn.execute(_STATS_SQL).fetchall())
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connections and shut down the search pool."""
+        if self._search_pool is not None:
+            self._search_pool.shutdown(wait=True)
+            self._search_pool = None
+        with self._read_conns_lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
+        self._local = threading.local()
         if self._conn:
             self._conn.close()
             self._conn = None
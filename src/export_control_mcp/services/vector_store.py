@@ -1,16 +1,74 @@
 """Vector store service using ChromaDB."""
 
 import logging
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import chromadb
+import numpy as np
+import numpy.typing as npt
 from chromadb import ClientAPI, Collection
 
+from export_control_mcp.config import get_settings
 from export_control_mcp.models.errors import VectorStoreError
 from export_control_mcp.models.regulations import RegulationChunk, RegulationType
 
 logger = logging.getLogger(__name__)
 
+_ALL_TYPES = tuple(RegulationType)
+
+# Part filters like "730", "part 730" or "PART 730" map to the stored "Part 730"
+_PART_PATTERN = re.compile(r"^\s*(?:part\s*)?(\d+)\s*$", re.IGNORECASE)
+
+
+def _normalize_part(part: str) -> str:
+    """Return the stored form of a part filter so it matches by equality."""
+    match = _PART_PATTERN.match(part)
+    return f"Part {match.group(1)}" if match else part
+
+
+def metadata_to_chunk(metadata: dict[str, Any]) -> RegulationChunk:
+    """
+    Rebuild a RegulationChunk from a search or get_by_id result.
+
+    Chunks are stored as flat metadata plus the document text. Stores built
+    before that layout carry the whole chunk serialized under ``full_json``,
+    which is still honoured.
+
+    Args:
+        metadata: Result dict from search() or get_by_id().
+
+    Returns:
+        The reconstructed regulation chunk.
+    """
+    full_json = metadata.get("full_json")
+    if full_json:
+        return RegulationChunk.model_validate_json(full_json)
+
+    # Fields were written by this service, so skip re-validating them
+    return RegulationChunk.model_construct(
+        id=metadata["id"],
+        regulation_type=RegulationType(metadata["regulation_type"]),
+        part=metadata["part"],
+        section=metadata["section"] or None,
+        title=metadata["title"],
+        content=metadata["content"],
+        citation=metadata["citation"],
+        chunk_index=metadata["chunk_index"],
+    )
+
+
+def _scored(
+    batch: tuple[list[str], list[dict[str, Any]], npt.NDArray[np.float64]],
+) -> list[tuple[dict[str, Any], float]]:
+    """Pair the metadata of a hydrated collection query with its scores."""
+    _, metadatas, similarities = batch
+    return [
+        (metadata, float(score)) for metadata, score in zip(metadatas, similarities, strict=True)
+    ]
+
 
 class VectorStoreService:
     """ChromaDB wrapper for export control regulation storage and retrieval."""
@@ -19,6 +77,14 @@ class VectorStoreService:
     EAR_COLLECTION = "ear_regulations"
     ITAR_COLLECTION = "itar_regulations"
 
+    # Maximum chunks per collection.add() call; Chroma ingest throughput
+    # peaks around 100-250 records per batch.
+    ADD_BATCH_MAX = 200
+
+    # HNSW write-path tuning: buffer inserts before indexing and persisting
+    HNSW_BATCH_SIZE = 1000
+    HNSW_SYNC_THRESHOLD = 10000
+
     def __init__(self, db_path: str):
         """
         Initialize ChromaDB in persistent mode.
@@ -26,9 +92,24 @@ class VectorStoreService:
         Args:
             db_path: Path to the ChromaDB storage directory.
         """
+        settings = get_settings()
         self._db_path = db_path
         self._client: ClientAPI | None = None
         self._collections: dict[str, Collection] = {}
+        self._search_pool: ThreadPoolExecutor | None = None
+        # Index parameters only take effect for newly created collections;
+        # get_or_create_collection() ignores them for existing ones, so a
+        # store picks up new values only after a re-ingest recreates it.
+        # Build threads are left to Chroma, which sizes them per host at
+        # runtime instead of persisting this machine's core count.
+        self._collection_metadata: dict[str, Any] = {
+            "hnsw:space": "cosine",
+            "hnsw:M": settings.chroma_hnsw_m,
+            "hnsw:construction_ef": settings.chroma_hnsw_construction_ef,
+            "hnsw:search_ef": settings.chroma_hnsw_search_ef,
+            "hnsw:batch_size": self.HNSW_BATCH_SIZE,
+            "hnsw:sync_threshold": self.HNSW_SYNC_THRESHOLD,
+        }
 
     @property
     def client(self) -> ClientAPI:
@@ -42,17 +123,32 @@ class VectorStoreService:
                 ) from e
         return self._client
 
-    def _get_collection(self, regulation_type: RegulationType) -> Collection:
-        """Get or create a collection for the given regulation type."""
-        collection_name = (
+    def _collection_name(self, regulation_type: RegulationType) -> str:
+        """Return the collection name for the given regulation type."""
+        return (
             self.EAR_COLLECTION if regulation_type == RegulationType.EAR else self.ITAR_COLLECTION
         )
 
+    def _existing_types(self, types: tuple[RegulationType, ...]) -> list[RegulationType]:
+        """Return the subset of types whose collections already exist."""
+        if all(self._collection_name(t) in self._collections for t in types):
+            return list(types)
+        try:
+            # chromadb 0.6 returns names; other versions return Collection objects
+            existing = {getattr(c, "name", c) for c in self.client.list_collections()}
+        except Exception as e:
+            raise VectorStoreError(f"Failed to list collections: {e}") from e
+        return [t for t in types if self._collection_name(t) in existing]
+
+    def _get_collection(self, regulation_type: RegulationType) -> Collection:
+        """Get or create a collection for the given regulation type."""
+        collection_name = self._collection_name(regulation_type)
+
         if collection_name not in self._collections:
             try:
                 self._collections[collection_name] = self.client.get_or_create_collection(
                     name=collection_name,
-                    metadata={"hnsw:space": "cosine"},
+                    metadata=self._collection_metadata,
                 )
             except Exception as e:
                 raise VectorStoreError(
@@ -77,7 +173,7 @@ class VectorStoreService:
         try:
             collection.add(
                 ids=[chunk.id],
-                embeddings=[embedding],
+                embeddings=np.asarray([embedding], dtype=np.float32),
                 documents=[chunk.content],
                 metadatas=[
                     {
@@ -87,7 +183,6 @@ class VectorStoreService:
                         "title": chunk.title,
                         "citation": chunk.citation,
                         "chunk_index": chunk.chunk_index,
-                        "full_json": chunk.model_dump_json(),
                     }
                 ],
             )
@@ -119,38 +214,121 @@ class VectorStoreService:
             return
 
         # Group chunks by regulation type
-        by_type: dict[RegulationType, tuple[list[RegulationChunk], list[list[float]]]] = {}
+        by_type: defaultdict[RegulationType, tuple[list[RegulationChunk], list[list[float]]]] = (
+            defaultdict(lambda: ([], []))
+        )
         for chunk, embedding in zip(chunks, embeddings, strict=True):
-            if chunk.regulation_type not in by_type:
-                by_type[chunk.regulation_type] = ([], [])
-            by_type[chunk.regulation_type][0].append(chunk)
-            by_type[chunk.regulation_type][1].append(embedding)
+            type_chunks, type_embeddings = by_type[chunk.regulation_type]
+            type_chunks.append(chunk)
+            type_embeddings.append(embedding)
 
-        # Add each group to its collection
+        # Add each group to its collection in bounded sub-batches
         for reg_type, (type_chunks, type_embeddings) in by_type.items():
             collection = self._get_collection(reg_type)
-            try:
-                collection.add(
-                    ids=[c.id for c in type_chunks],
-                    embeddings=type_embeddings,
-                    documents=[c.content for c in type_chunks],
-                    metadatas=[
-                        {
-                            "regulation_type": c.regulation_type.value,
-                            "part": c.part,
-                            "section": c.section or "",
-                            "title": c.title,
-                            "citation": c.citation,
-                            "chunk_index": c.chunk_index,
-                            "full_json": c.model_dump_json(),
-                        }
-                        for c in type_chunks
-                    ],
+            vectors = np.asarray(type_embeddings, dtype=np.float32)
+
+            # Build ids, documents and metadata in a single pass over the group
+            reg_type_value = reg_type.value
+            ids: list[str] = []
+            documents: list[str] = []
+            metadatas: list[dict[str, Any]] = []
+            for c in type_chunks:
+                ids.append(c.id)
+                documents.append(c.content)
+                metadatas.append(
+                    {
+                        "regulation_type": reg_type_value,
+                        "part": c.part,
+                        "section": c.section or "",
+                        "title": c.title,
+                        "citation": c.citation,
+                        "chunk_index": c.chunk_index,
+                    }
                 )
-            except Exception as e:
-                raise VectorStoreError(
-                    f"Failed to add batch of {len(type_chunks)} chunks: {e}"
-                ) from e
+
+            for start in range(0, len(ids), self.ADD_BATCH_MAX):
+                batch = slice(start, start + self.ADD_BATCH_MAX)
+                try:
+                    collection.add(
+                        ids=ids[batch],
+                        embeddings=vectors[batch],
+                        documents=documents[batch],
+                        metadatas=metadatas[batch],
+                    )
+                except Exception as e:
+                    raise VectorStoreError(
+                        f"Failed to add batch of {len(ids[batch])} chunks: {e}"
+                    ) from e
+
+    def _get_search_pool(self) -> ThreadPoolExecutor:
+        """Return the thread pool used for multi-collection searches."""
+        if self._search_pool is None:
+            self._search_pool = ThreadPoolExecutor(
+                max_workers=len(RegulationType),
+                thread_name_prefix="vector-search",
+            )
+        return self._search_pool
+
+    def _query_collection(
+        self,
+        collection: Collection,
+        query_vectors: npt.NDArray[np.float32],
+        limit: int,
+        where: dict[str, Any] | None,
+        hydrate: bool,
+    ) -> tuple[list[str], list[dict[str, Any]], npt.NDArray[np.float64]]:
+        """
+        Query one collection for matching ids and similarity scores.
+
+        With ``hydrate`` the metadata and documents come back in the same
+        call; otherwise only ids and distances are read and the metadata
+        list is empty.
+        """
+        include = ["metadatas", "documents", "distances"] if hydrate else ["distances"]
+        try:
+            results = collection.query(
+                query_embeddings=query_vectors,
+                n_results=limit,
+                where=where,
+                include=include,
+            )
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}") from e
+
+        ids = results["ids"][0]
+        if not (ids and results["distances"]):
+            return [], [], np.empty(0)
+
+        # Cosine distance to similarity: similarity = 1 - distance
+        similarities = np.clip(1.0 - np.asarray(results["distances"][0]), 0.0, None)
+        if not hydrate:
+            return ids, [], similarities
+
+        metadatas = [
+            {**metadata, "id": chunk_id, "content": document}
+            for chunk_id, metadata, document in zip(
+                ids,
+                results["metadatas"][0],
+                results["documents"][0],
+                strict=True,
+            )
+        ]
+        return ids, metadatas, similarities
+
+    def _fetch_by_ids(self, collection: Collection, ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch stored chunks as result dicts keyed by chunk id."""
+        results = collection.get(ids=ids, include=["metadatas", "documents"])
+        if not (results["metadatas"] and results["documents"]):
+            return {}
+        return {
+            chunk_id: {**metadata, "id": chunk_id, "content": document}
+            for chunk_id, metadata, document in zip(
+                results["ids"],
+                results["metadatas"],
+                results["documents"],
+                strict=True,
+            )
+        }
 
     def search(
         self,
@@ -165,11 +343,12 @@ class VectorStoreService:
         Args:
             query_embedding: Query vector.
             regulation_type: Optional regulation type filter (EAR or ITAR).
-            part: Optional part filter (e.g., "Part 730").
+            part: Optional part filter (e.g., "Part 730", "730").
             limit: Maximum number of results.
 
         Returns:
             List of (metadata, score) tuples, where score is similarity (0-1).
+            Each metadata dict also carries the chunk ``id`` and ``content``.
 
         Raises:
             VectorStoreError: If the search fails.
@@ -183,34 +362,90 @@ class VectorStoreService:
                 self._get_collection(RegulationType.ITAR),
             ]
 
-        all_results: list[tuple[dict[str, Any], float]] = []
-
-        for collection in collections:
-            try:
-                where = {"part": part} if part else None
-                results = collection.query(
-                    query_embeddings=[query_embedding],
-                    n_results=limit,
-                    where=where,
-                    include=["metadatas", "distances"],
-                )
+        where = {"part": _normalize_part(part)} if part else None
+        # Convert once and share the (1, dim) float32 array across collections
+        query_vectors = np.asarray([query_embedding], dtype=np.float32)
 
-                if results["metadatas"] and results["distances"]:
-                    for metadata, distance in zip(
-                        results["metadatas"][0],
-                        results["distances"][0],
-                        strict=True,
-                    ):
-                        # Cosine distance to similarity: similarity = 1 - distance
-                        similarity = max(0.0, 1.0 - distance)
-                        all_results.append((metadata, similarity))
+        # Every hit from a single collection is kept, so fetch it in one call
+        if len(collections) == 1:
+            return _scored(
+                self._query_collection(collections[0], query_vectors, limit, where, hydrate=True)
+            )
 
+        # Query multiple collections concurrently; Chroma releases the GIL
+        # during HNSW traversal, so latency is max(EAR, ITAR) rather than sum.
+        # Only ids and distances are read until the merged top results are known.
+        pool = self._get_search_pool()
+        futures = [
+            pool.submit(self._query_collection, c, query_vectors, limit, where, False)
+            for c in collections
+        ]
+        batches = [f.result() for f in futures]
+
+        ids = [chunk_id for batch_ids, _, _ in batches for chunk_id in batch_ids]
+        top = min(limit, len(ids))
+        if top <= 0:
+            return []
+
+        # Select the top results without sorting the full candidate list
+        similarities = np.concatenate([batch_similarities for _, _, batch_similarities in batches])
+        owners = np.repeat(np.arange(len(batches)), [len(batch_ids) for batch_ids, _, _ in batches])
+        order = np.argpartition(-similarities, top - 1)[:top]
+        order = order[np.argsort(-similarities[order], kind="stable")]
+
+        # Hydrate only the surviving hits, with one get() per collection
+        hydrated: dict[tuple[int, str], dict[str, Any]] = {}
+        for index, collection in enumerate(collections):
+            survivor_ids = [ids[i] for i in order if owners[i] == index]
+            if not survivor_ids:
+                continue
+            try:
+                fetched = self._fetch_by_ids(collection, survivor_ids)
             except Exception as e:
                 raise VectorStoreError(f"Search failed: {e}") from e
+            hydrated.update(((index, chunk_id), metadata) for chunk_id, metadata in fetched.items())
+
+        return [
+            (hydrated[key], float(similarities[i]))
+            for i in order
+            if (key := (int(owners[i]), ids[i])) in hydrated
+        ]
+
+    def search_each_type(
+        self,
+        query_embedding: list[float],
+        part: str | None = None,
+        limit: int = 10,
+    ) -> dict[RegulationType, list[tuple[dict[str, Any], float]]]:
+        """
+        Search each regulation type separately for the same query vector.
 
-        # Sort by score and return top results
-        all_results.sort(key=lambda x: x[1], reverse=True)
-        return all_results[:limit]
+        Unlike search() without a type filter, results are not merged: every
+        type gets its own top ``limit`` hits, as if search() were called once
+        per type. The collections are queried concurrently.
+
+        Args:
+            query_embedding: Query vector.
+            part: Optional part filter (e.g., "Part 730", "730").
+            limit: Maximum number of results per regulation type.
+
+        Returns:
+            Mapping of regulation type to (metadata, score) tuples, as
+            returned by search().
+
+        Raises:
+            VectorStoreError: If the search fails.
+        """
+        collections = {t: self._get_collection(t) for t in _ALL_TYPES}
+        where = {"part": _normalize_part(part)} if part else None
+        query_vectors = np.asarray([query_embedding], dtype=np.float32)
+
+        pool = self._get_search_pool()
+        futures = {
+            t: pool.submit(self._query_collection, c, query_vectors, limit, where, True)
+            for t, c in collections.items()
+        }
+        return {t: _scored(f.result()) for t, f in futures.items()}
 
     def get_by_id(self, chunk_id: str, regulation_type: RegulationType) -> dict[str, Any] | None:
         """
@@ -221,7 +456,7 @@ class VectorStoreService:
             regulation_type: The regulation type to search in.
 
         Returns:
-            Chunk metadata dict or None if not found.
+            Chunk metadata dict (with ``id`` and ``content``) or None if not found.
 
         Raises:
             VectorStoreError: If the operation fails.
@@ -229,14 +464,7 @@ class VectorStoreService:
         collection = self._get_collection(regulation_type)
 
         try:
-            results = collection.get(
-                ids=[chunk_id],
-                include=["metadatas"],
-            )
-            if results["metadatas"]:
-                return results["metadatas"][0]
-            return None
-
+            return self._fetch_by_ids(collection, [chunk_id]).get(chunk_id)
         except Exception as e:
             raise VectorStoreError(f"Failed to get chunk '{chunk_id}': {e}") from e
 
@@ -250,16 +478,12 @@ class VectorStoreService:
         Returns:
             Number of stored chunks.
         """
-        if regulation_type:
-            return self._get_collection(regulation_type).count()
+        types = (regulation_type,) if regulation_type else _ALL_TYPES
 
-        total = 0
-        for reg_type in RegulationType:
-            try:
-                total += self._get_collection(reg_type).count()
-            except Exception:
-                logger.debug("Collection %s not found, skipping", reg_type.value)
-        return total
+        # Counting must not create collections that were never populated
+        return sum(
+            self._get_collection(reg_type).count() for reg_type in self._existing_types(types)
+        )
 
     def delete_all(self, regulation_type: RegulationType | None = None) -> None:
         """
@@ -270,13 +494,20 @@ class VectorStoreService:
 
         Warning: Use with caution.
         """
-        types = [regulation_type] if regulation_type else list(RegulationType)
+        types = (regulation_type,) if regulation_type else _ALL_TYPES
 
-        for reg_type in types:
+        # Drop whole collections rather than fetching and deleting every id;
+        # _get_collection() recreates them on next use.
+        for reg_type in self._existing_types(types):
+            collection_name = self._collection_name(reg_type)
             try:
-                collection = self._get_collection(reg_type)
-                all_ids = collection.get()["ids"]
-                if all_ids:
-                    collection.delete(ids=all_ids)
+                self.client.delete_collection(name=collection_name)
             except Exception as e:
                 raise VectorStoreError(f"Failed to delete chunks: {e}") from e
+            self._collections.pop(collection_name, None)
+
+    def close(self) -> None:
+        """Shut down the search pool."""
+        if self._search_pool is not None:
+            self._search_pool.shutdown(wait=True)
+            self._search_pool = None
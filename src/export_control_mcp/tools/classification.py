@@ -4,8 +4,13 @@ Provides tools for AI-assisted classification suggestions, decision tree
 guidance, and license exception evaluation.
 """
 
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from export_control_mcp.audit import audit_log
 from export_control_mcp.models.classification import (
     ClassificationConfidence,
@@ -26,7 +31,7 @@ from export_control_mcp.resources.reference_data import (
 from export_control_mcp.server import mcp
 
 # Keywords that suggest ITAR jurisdiction
-ITAR_KEYWORDS = [
+ITAR_KEYWORDS = (
     "military",
     "defense",
     "weapon",
@@ -77,10 +82,10 @@ ITAR_KEYWORDS = [
     "drone",
     "surveillance",
     "reconnaissance",
-]
+)
 
 # Keywords that suggest EAR jurisdiction (dual-use)
-EAR_KEYWORDS = [
+EAR_KEYWORDS = (
     "commercial",
     "industrial",
     "semiconductor",
@@ -122,14 +127,14 @@ EAR_KEYWORDS = [
     "enrichment",
     "gas turbine",
     "rocket engine",
-]
+)
 
 # ECCN category keywords for suggesting classifications
 ECCN_CATEGORY_KEYWORDS = {
-    0: ["nuclear", "reactor", "enrichment", "uranium", "plutonium", "deuterium", "tritium"],
-    1: ["chemical", "precursor", "biological", "pathogen", "toxin", "composite", "alloy", "fiber"],
-    2: ["machine tool", "cnc", "manufacturing", "processing", "casting", "forging", "welding"],
-    3: [
+    0: ("nuclear", "reactor", "enrichment", "uranium", "plutonium", "deuterium", "tritium"),
+    1: ("chemical", "precursor", "biological", "pathogen", "toxin", "composite", "alloy", "fiber"),
+    2: ("machine tool", "cnc", "manufacturing", "processing", "casting", "forging", "welding"),
+    3: (
         "electronic",
         "semiconductor",
         "integrated circuit",
@@ -137,44 +142,254 @@ ECCN_CATEGORY_KEYWORDS = {
         "fpga",
         "asic",
         "rf",
-    ],
-    4: ["computer", "digital", "processor", "storage", "memory", "server", "supercomputer"],
-    5: [
+    ),
+    4: ("computer", "digital", "processor", "storage", "memory", "server", "supercomputer"),
+    5: (
         "telecommunications",
         "encryption",
         "cryptography",
         "network",
         "wireless",
         "satellite comm",
-    ],
-    6: ["sensor", "laser", "camera", "imaging", "optical", "infrared", "thermal", "spectrometer"],
-    7: ["navigation", "inertial", "gps", "gyroscope", "accelerometer", "altimeter", "avionics"],
-    8: ["marine", "submarine", "underwater", "sonar", "propeller", "hull"],
-    9: ["aerospace", "propulsion", "turbine", "rocket", "engine", "spacecraft", "uav"],
+    ),
+    6: ("sensor", "laser", "camera", "imaging", "optical", "infrared", "thermal", "spectrometer"),
+    7: ("navigation", "inertial", "gps", "gyroscope", "accelerometer", "altimeter", "avionics"),
+    8: ("marine", "submarine", "underwater", "sonar", "propeller", "hull"),
+    9: ("aerospace", "propulsion", "turbine", "rocket", "engine", "spacecraft", "uav"),
+}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes between words.
+
+    The pattern is structured like a trie, so the regex engine follows a single
+    branch per character instead of retrying every word at each position.  At
+    any position the longest matching word wins.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+# Reference-data ECCNs grouped by CCL category (the leading digit)
+_ECCNS_BY_CATEGORY: dict[int, list[str]] = {
+    cat: [eccn for eccn in ECCN_DATA if eccn.startswith(str(cat))] for cat in ECCN_CATEGORY_KEYWORDS
 }
 
 
-def _analyze_description(description: str) -> dict[str, Any]:
-    """Analyze item description for classification indicators."""
-    desc_lower = description.lower()
+# (label, lowercased title and description) per USML category.  The fields are
+# joined by a newline so a description word cannot match across them.
+_USML_SEARCH_TEXT: list[tuple[str, str]] = [
+    (f"Category {cat_num} - {data['title']}", f"{data['title']}\n{data['description']}".lower())
+    for cat_num, data in USML_CATEGORIES.items()
+]
+
+
+@lru_cache(maxsize=4096)
+def _usml_word_mask(word: str) -> int:
+    """Bitmask of the _USML_SEARCH_TEXT entries whose text contains ``word``.
 
-    itar_matches = [kw for kw in ITAR_KEYWORDS if kw in desc_lower]
-    ear_matches = [kw for kw in EAR_KEYWORDS if kw in desc_lower]
+    Description vocabulary repeats heavily between calls, so each distinct word
+    is checked against the category texts only once.
+    """
+    mask = 0
+    for bit, (_, search_text) in enumerate(_USML_SEARCH_TEXT):
+        if word in search_text:
+            mask |= 1 << bit
+    return mask
+
+
+# Suggested jurisdictions that warrant a USML review
+_ITAR_JURISDICTIONS = frozenset([JurisdictionType.ITAR, JurisdictionType.DUAL_USE])
+
+# Reasoning given for each suggested jurisdiction
+_JURISDICTION_REASONING = {
+    JurisdictionType.ITAR: (
+        "Item appears to be primarily designed for military/defense applications."
+    ),
+    JurisdictionType.DUAL_USE: "Item has both commercial and potential military applications.",
+    JurisdictionType.EAR: (
+        "Item appears to be a dual-use commercial item potentially controlled under EAR."
+    ),
+    JurisdictionType.EAR99: "Item does not appear to match specific control list entries.",
+}
 
-    # Check ECCN category keywords
-    category_matches = {}
-    for cat, keywords in ECCN_CATEGORY_KEYWORDS.items():
-        matches = [kw for kw in keywords if kw in desc_lower]
-        if matches:
-            category_matches[cat] = matches
+# Questions asked of every item before a definitive classification
+_QUESTIONS_TO_RESOLVE = (
+    "Was this item specifically designed, developed, or modified for military use?",
+    "Is the item derived from or related to classified technology?",
+    "What are the exact technical specifications (parameters that may trigger control thresholds)?",
+    "Who is the intended end-user and what is the intended end-use?",
+)
+
+_BASE_NEXT_STEPS = (
+    "Review the suggested ECCN/USML entries in detail",
+    "Compare item specifications against control list technical parameters",
+    "Consult with export control officer or legal counsel",
+)
+_CJ_REQUEST_STEP = "Consider submitting Commodity Jurisdiction (CJ) request to DDTC"
+_BIS_REQUEST_STEP = "Consider submitting classification request to BIS"
+
+# Recommended next steps for each suggested jurisdiction
+_NEXT_STEPS = {
+    JurisdictionType.ITAR: (*_BASE_NEXT_STEPS, _CJ_REQUEST_STEP),
+    JurisdictionType.DUAL_USE: (*_BASE_NEXT_STEPS, _CJ_REQUEST_STEP, _BIS_REQUEST_STEP),
+    JurisdictionType.EAR: (*_BASE_NEXT_STEPS, _BIS_REQUEST_STEP),
+    JurisdictionType.EAR99: (*_BASE_NEXT_STEPS, _BIS_REQUEST_STEP),
+}
+
+# Matched keywords listed per jurisdiction in key_factors
+_KEYWORDS_SHOWN = 5
+
+# All keyword lists tagged with their bucket ("itar", "ear" or an ECCN category),
+# in the order the lists declare them.
+_KEYWORD_ENTRIES: tuple[tuple[str | int, str], ...] = (
+    *(("itar", kw) for kw in ITAR_KEYWORDS),
+    *(("ear", kw) for kw in EAR_KEYWORDS),
+    *((cat, kw) for cat, keywords in ECCN_CATEGORY_KEYWORDS.items() for kw in keywords),
+)
+
+# Matched keyword -> indexes of every entry it implies.  The scan only reports the
+# longest keyword at each position, so shorter keywords that are prefixes of it
+# ("laser" for "laser weapon") are folded in here.
+_KEYWORD_HITS: dict[str, tuple[int, ...]] = {
+    match: tuple(i for i, (_, kw) in enumerate(_KEYWORD_ENTRIES) if match.startswith(kw))
+    for match in {kw for _, kw in _KEYWORD_ENTRIES}
+}
+
+# Zero-width lookahead so overlapping keywords ("submarine" and "marine") are all
+# reported in one pass over the description.
+_KEYWORD_RE = re.compile(f"(?=({_trie_pattern(_KEYWORD_HITS)}))")
+
+
+def _analyze_description(desc_lower: str) -> dict[str, Any]:
+    """Analyze a lowercased item description for classification indicators.
+
+    Returns ITAR/EAR keyword counts for scoring, the first few matched
+    keywords of each for display, and the matched ECCN categories in order.
+    """
+    hits: set[int] = set()
+    for match in set(_KEYWORD_RE.findall(desc_lower)):
+        hits.update(_KEYWORD_HITS[match])
+
+    counts = {"itar": 0, "ear": 0}
+    shown: dict[str, list[str]] = {"itar": [], "ear": []}
+    categories: list[int] = []
+    for index in sorted(hits):
+        bucket, kw = _KEYWORD_ENTRIES[index]
+        if isinstance(bucket, int):
+            if not categories or categories[-1] != bucket:
+                categories.append(bucket)
+        else:
+            counts[bucket] += 1
+            if counts[bucket] <= _KEYWORDS_SHOWN:
+                shown[bucket].append(kw)
 
     return {
-        "itar_keywords": itar_matches,
-        "ear_keywords": ear_matches,
-        "category_matches": category_matches,
+        "itar_count": counts["itar"],
+        "itar_keywords": shown["itar"],
+        "ear_count": counts["ear"],
+        "ear_keywords": shown["ear"],
+        "categories": categories,
     }
 
 
+@lru_cache(maxsize=1024)
+def _classification_response(item_description: str, additional_context: str) -> bytes:
+    """Build the serialized suggest_classification response.
+
+    Results are cached per input, so agents retrying the same description skip
+    the analysis. Callers decode the bytes and each gets its own dict.
+    """
+    desc_lower = item_description.lower()
+    if additional_context:
+        analysis = _analyze_description(f"{desc_lower} {additional_context.lower()}")
+    else:
+        analysis = _analyze_description(desc_lower)
+
+    itar_score = analysis["itar_count"]
+    ear_score = analysis["ear_count"]
+
+    # Determine likely jurisdiction
+    if itar_score > ear_score * 2:
+        jurisdiction = JurisdictionType.ITAR
+        confidence = (
+            ClassificationConfidence.MEDIUM if itar_score >= 3 else ClassificationConfidence.LOW
+        )
+    elif ear_score > itar_score * 2:
+        jurisdiction = JurisdictionType.EAR
+        confidence = (
+            ClassificationConfidence.MEDIUM if ear_score >= 3 else ClassificationConfidence.LOW
+        )
+    elif itar_score > 0 and ear_score > 0:
+        jurisdiction = JurisdictionType.DUAL_USE
+        confidence = ClassificationConfidence.LOW
+    elif ear_score > 0:
+        jurisdiction = JurisdictionType.EAR
+        confidence = ClassificationConfidence.LOW
+    else:
+        jurisdiction = JurisdictionType.EAR99
+        confidence = ClassificationConfidence.LOW
+
+    # Suggest ECCNs based on category matches
+    suggested_eccns: list[str] = []
+    for category in analysis["categories"]:
+        suggested_eccns.extend(_ECCNS_BY_CATEGORY[category][: 5 - len(suggested_eccns)])
+        if len(suggested_eccns) >= 5:
+            break
+
+    # Suggest USML categories for ITAR items
+    suggested_usml: list[str] = []
+    if jurisdiction in _ITAR_JURISDICTIONS:
+        matched = 0
+        for word in set(desc_lower.split()):
+            matched |= _usml_word_mask(word)
+        # Lowest set bits first, i.e. categories in reference-data order
+        while matched and len(suggested_usml) < 3:
+            lowest = matched & -matched
+            suggested_usml.append(_USML_SEARCH_TEXT[lowest.bit_length() - 1][0])
+            matched ^= lowest
+
+    # Build key factors
+    key_factors = []
+    if analysis["itar_keywords"]:
+        key_factors.append(f"ITAR-related terms detected: {', '.join(analysis['itar_keywords'])}")
+    if analysis["ear_keywords"]:
+        key_factors.append(f"Dual-use/EAR terms detected: {', '.join(analysis['ear_keywords'])}")
+    if analysis["categories"]:
+        cats = [f"Category {c}" for c in analysis["categories"]]
+        key_factors.append(f"Potentially relevant ECCN categories: {', '.join(cats)}")
+
+    # Build reasoning
+    reasoning = _JURISDICTION_REASONING[jurisdiction]
+
+    suggestion = ClassificationSuggestion(
+        item_description=item_description,
+        suggested_jurisdiction=jurisdiction,
+        confidence=confidence,
+        suggested_eccns=suggested_eccns,
+        suggested_usml_categories=suggested_usml,
+        reasoning=reasoning,
+        key_factors=key_factors,
+        questions_to_resolve=list(_QUESTIONS_TO_RESOLVE),
+        next_steps=list(_NEXT_STEPS[jurisdiction]),
+    )
+
+    return orjson.dumps(suggestion.to_dict())
+
+
 @mcp.tool()
 @audit_log
 async def suggest_classification(
@@ -216,120 +431,124 @@ async def suggest_classification(
         - next_steps: Recommended next steps
         - disclaimer: Legal disclaimer about the advisory nature
     """
-    analysis = _analyze_description(item_description + " " + additional_context)
+    result: dict[str, Any] = orjson.loads(
+        _classification_response(item_description, additional_context)
+    )
+    return result
 
-    itar_score = len(analysis["itar_keywords"])
-    ear_score = len(analysis["ear_keywords"])
 
-    # Determine likely jurisdiction
-    if itar_score > ear_score * 2:
-        jurisdiction = JurisdictionType.ITAR
-        confidence = (
-            ClassificationConfidence.MEDIUM if itar_score >= 3 else ClassificationConfidence.LOW
-        )
-    elif ear_score > itar_score * 2:
-        jurisdiction = JurisdictionType.EAR
-        confidence = (
-            ClassificationConfidence.MEDIUM if ear_score >= 3 else ClassificationConfidence.LOW
-        )
-    elif itar_score > 0 and ear_score > 0:
-        jurisdiction = JurisdictionType.DUAL_USE
-        confidence = ClassificationConfidence.LOW
-    elif ear_score > 0:
-        jurisdiction = JurisdictionType.EAR
-        confidence = ClassificationConfidence.LOW
-    else:
-        jurisdiction = JurisdictionType.EAR99
-        confidence = ClassificationConfidence.LOW
+# Upper bound on descriptions per suggest_classification_batch call
+_MAX_BATCH_ITEMS = 50
 
-    # Suggest ECCNs based on category matches
-    suggested_eccns = []
-    if analysis["category_matches"]:
-        for category in sorted(analysis["category_matches"].keys()):
-            # Look for ECCNs in this category from our reference data
-            for eccn in ECCN_DATA:
-                if eccn.startswith(str(category)):
-                    suggested_eccns.append(eccn)
-                    if len(suggested_eccns) >= 5:
-                        break
-            if len(suggested_eccns) >= 5:
-                break
-
-    # Suggest USML categories for ITAR items
-    suggested_usml = []
-    if jurisdiction in [JurisdictionType.ITAR, JurisdictionType.DUAL_USE]:
-        desc_lower = item_description.lower()
-        for cat_num, cat_data in USML_CATEGORIES.items():
-            title_lower = cat_data["title"].lower()
-            desc_cat = cat_data["description"].lower()
-            if any(word in title_lower or word in desc_cat for word in desc_lower.split()):
-                suggested_usml.append(f"Category {cat_num} - {cat_data['title']}")
-                if len(suggested_usml) >= 3:
-                    break
 
-    # Build key factors
-    key_factors = []
-    if analysis["itar_keywords"]:
-        key_factors.append(
-            f"ITAR-related terms detected: {', '.join(analysis['itar_keywords'][:5])}"
-        )
-    if analysis["ear_keywords"]:
-        key_factors.append(
-            f"Dual-use/EAR terms detected: {', '.join(analysis['ear_keywords'][:5])}"
-        )
-    if analysis["category_matches"]:
-        cats = [f"Category {c}" for c in analysis["category_matches"]]
-        key_factors.append(f"Potentially relevant ECCN categories: {', '.join(cats)}")
+@mcp.tool()
+@audit_log
+async def suggest_classification_batch(
+    item_descriptions: list[str],
+    additional_context: str = "",
+) -> list[dict[str, Any]]:
+    """
+    Provide classification suggestions for several items in one call.
 
-    # Build reasoning
-    reasoning_parts = []
-    if jurisdiction == JurisdictionType.ITAR:
-        reasoning_parts.append(
-            "Item appears to be primarily designed for military/defense applications."
-        )
-    elif jurisdiction == JurisdictionType.DUAL_USE:
-        reasoning_parts.append("Item has both commercial and potential military applications.")
-    elif jurisdiction == JurisdictionType.EAR:
-        reasoning_parts.append(
-            "Item appears to be a dual-use commercial item potentially controlled under EAR."
-        )
-    else:
-        reasoning_parts.append("Item does not appear to match specific control list entries.")
+    Runs the same analysis as suggest_classification on each description,
+    so every result matches what that tool returns for the item on its own.
+    Useful for screening a parts list or bill of materials without one
+    round trip per item.
 
-    reasoning = " ".join(reasoning_parts)
+    IMPORTANT: This is an advisory tool only. Official classification
+    requires formal commodity jurisdiction (CJ) determination from DDTC
+    or classification request to BIS.
 
-    # Questions to resolve
-    questions = [
-        "Was this item specifically designed, developed, or modified for military use?",
-        "Is the item derived from or related to classified technology?",
-        "What are the exact technical specifications (parameters that may trigger control thresholds)?",
-        "Who is the intended end-user and what is the intended end-use?",
-    ]
+    Args:
+        item_descriptions: Descriptions of the items to classify (at most 50).
+                          Each should be as detailed as for suggest_classification.
+        additional_context: Optional context shared by every item, such as the
+                          program, end-use, or customer.
 
-    # Next steps
-    next_steps = [
-        "Review the suggested ECCN/USML entries in detail",
-        "Compare item specifications against control list technical parameters",
-        "Consult with export control officer or legal counsel",
+    Returns:
+        List of suggestions in the same order as item_descriptions, each with
+        the fields returned by suggest_classification. If more than 50
+        descriptions are given, a single entry with an "error" key.
+    """
+    if len(item_descriptions) > _MAX_BATCH_ITEMS:
+        return [
+            {
+                "error": f"At most {_MAX_BATCH_ITEMS} items can be classified per call, "
+                f"got {len(item_descriptions)}.",
+            }
+        ]
+
+    return [
+        orjson.loads(_classification_response(description, additional_context))
+        for description in item_descriptions
     ]
-    if jurisdiction == JurisdictionType.ITAR or jurisdiction == JurisdictionType.DUAL_USE:
-        next_steps.append("Consider submitting Commodity Jurisdiction (CJ) request to DDTC")
-    if jurisdiction in [JurisdictionType.EAR, JurisdictionType.DUAL_USE, JurisdictionType.EAR99]:
-        next_steps.append("Consider submitting classification request to BIS")
 
-    suggestion = ClassificationSuggestion(
-        item_description=item_description,
-        suggested_jurisdiction=jurisdiction,
-        confidence=confidence,
-        suggested_eccns=suggested_eccns,
-        suggested_usml_categories=suggested_usml,
-        reasoning=reasoning,
-        key_factors=key_factors,
-        questions_to_resolve=questions,
-        next_steps=next_steps,
-    )
 
-    return suggestion.to_dict()
+# Steps of the simplified BIS classification decision tree
+_DECISION_STEPS = (
+    DecisionTreeStep(
+        step_number=1,
+        question="Is the item subject to the exclusive jurisdiction of another U.S. government agency?",
+        guidance="Items controlled by other agencies (e.g., NRC for nuclear materials, DOE for atomic energy) are not subject to the EAR. ITAR items are controlled by DDTC (State Department).",
+        options=[
+            "Yes - Subject to ITAR (defense article)",
+            "Yes - Subject to other agency (NRC, DOE, etc.)",
+            "No - Potentially subject to EAR",
+            "Unsure - Need commodity jurisdiction determination",
+        ],
+        regulation_reference="15 CFR 734.3",
+    ),
+    DecisionTreeStep(
+        step_number=2,
+        question="Is the item 'publicly available' technology or software, or the result of fundamental research?",
+        guidance="'Publicly available' means published or generally accessible. 'Fundamental research' is basic/applied research ordinarily published and shared broadly.",
+        options=[
+            "Yes - Published or publicly available",
+            "Yes - Result of fundamental research at accredited institution",
+            "No - Proprietary, controlled, or restricted information",
+            "Partially - Some aspects may be publicly available",
+        ],
+        regulation_reference="15 CFR 734.7-734.8",
+    ),
+    DecisionTreeStep(
+        step_number=3,
+        question="Is the item listed on the Commerce Control List (CCL)?",
+        guidance="Review the CCL (15 CFR 774 Supplement 1) to determine if the item matches a specific ECCN entry. Check technical parameters against control thresholds.",
+        options=[
+            "Yes - Item matches a specific ECCN",
+            "No - Item does not match any ECCN (may be EAR99)",
+            "Partially - Meets some but not all parameters",
+            "Unsure - Need detailed technical review",
+        ],
+        regulation_reference="15 CFR 774",
+    ),
+    DecisionTreeStep(
+        step_number=4,
+        question="What is the reason for control for the applicable ECCN?",
+        guidance="ECCNs have specific reasons for control (NS, MT, NP, CB, CC, etc.) which determine license requirements. Check the 'Reason for Control' column.",
+        options=[
+            "NS - National Security",
+            "MT - Missile Technology",
+            "NP - Nuclear Nonproliferation",
+            "CB - Chemical & Biological Weapons",
+            "CC - Crime Control",
+            "AT - Anti-Terrorism (most ECCNs have this)",
+            "Multiple reasons for control",
+        ],
+        regulation_reference="15 CFR 742",
+    ),
+    DecisionTreeStep(
+        step_number=5,
+        question="Does a license exception apply to this transaction?",
+        guidance="Review available license exceptions in 15 CFR 740. Consider destination country, end-user, and end-use restrictions.",
+        options=[
+            "Yes - License exception available (specify which)",
+            "No - No license exception applies",
+            "Maybe - Need to verify exception conditions",
+        ],
+        regulation_reference="15 CFR 740",
+    ),
+)
 
 
 @mcp.tool()
@@ -361,83 +580,17 @@ async def classification_decision_tree(
         - preliminary_result: Preliminary classification if determined
         - is_complete: Whether classification is complete
     """
-    # Decision tree steps
-    decision_steps = [
-        DecisionTreeStep(
-            step_number=1,
-            question="Is the item subject to the exclusive jurisdiction of another U.S. government agency?",
-            guidance="Items controlled by other agencies (e.g., NRC for nuclear materials, DOE for atomic energy) are not subject to the EAR. ITAR items are controlled by DDTC (State Department).",
-            options=[
-                "Yes - Subject to ITAR (defense article)",
-                "Yes - Subject to other agency (NRC, DOE, etc.)",
-                "No - Potentially subject to EAR",
-                "Unsure - Need commodity jurisdiction determination",
-            ],
-            regulation_reference="15 CFR 734.3",
-        ),
-        DecisionTreeStep(
-            step_number=2,
-            question="Is the item 'publicly available' technology or software, or the result of fundamental research?",
-            guidance="'Publicly available' means published or generally accessible. 'Fundamental research' is basic/applied research ordinarily published and shared broadly.",
-            options=[
-                "Yes - Published or publicly available",
-                "Yes - Result of fundamental research at accredited institution",
-                "No - Proprietary, controlled, or restricted information",
-                "Partially - Some aspects may be publicly available",
-            ],
-            regulation_reference="15 CFR 734.7-734.8",
-        ),
-        DecisionTreeStep(
-            step_number=3,
-            question="Is the item listed on the Commerce Control List (CCL)?",
-            guidance="Review the CCL (15 CFR 774 Supplement 1) to determine if the item matches a specific ECCN entry. Check technical parameters against control thresholds.",
-            options=[
-                "Yes - Item matches a specific ECCN",
-                "No - Item does not match any ECCN (may be EAR99)",
-                "Partially - Meets some but not all parameters",
-                "Unsure - Need detailed technical review",
-            ],
-            regulation_reference="15 CFR 774",
-        ),
-        DecisionTreeStep(
-            step_number=4,
-            question="What is the reason for control for the applicable ECCN?",
-            guidance="ECCNs have specific reasons for control (NS, MT, NP, CB, CC, etc.) which determine license requirements. Check the 'Reason for Control' column.",
-            options=[
-                "NS - National Security",
-                "MT - Missile Technology",
-                "NP - Nuclear Nonproliferation",
-                "CB - Chemical & Biological Weapons",
-                "CC - Crime Control",
-                "AT - Anti-Terrorism (most ECCNs have this)",
-                "Multiple reasons for control",
-            ],
-            regulation_reference="15 CFR 742",
-        ),
-        DecisionTreeStep(
-            step_number=5,
-            question="Does a license exception apply to this transaction?",
-            guidance="Review available license exceptions in 15 CFR 740. Consider destination country, end-user, and end-use restrictions.",
-            options=[
-                "Yes - License exception available (specify which)",
-                "No - No license exception applies",
-                "Maybe - Need to verify exception conditions",
-            ],
-            regulation_reference="15 CFR 740",
-        ),
-    ]
-
     # Clamp step to valid range
-    step = max(1, min(step, len(decision_steps)))
+    step = max(1, min(step, len(_DECISION_STEPS)))
 
-    current = decision_steps[step - 1]
-    completed = decision_steps[: step - 1]
+    current = _DECISION_STEPS[step - 1]
+    completed = list(_DECISION_STEPS[: step - 1])
 
     # Determine if we've reached a conclusion
-    is_complete = step > len(decision_steps)
+    is_complete = step > len(_DECISION_STEPS)
     preliminary_result = ""
 
-    if step == len(decision_steps):
+    if step == len(_DECISION_STEPS):
         preliminary_result = "Based on your answers, proceed to determine if a license is required using the Commerce Country Chart (15 CFR 738 Supplement 1) for your specific destination."
 
     result = DecisionTreeResult(
@@ -451,42 +604,139 @@ async def classification_decision_tree(
     return result.to_dict()
 
 
-@mcp.tool()
-@audit_log
-async def check_license_exception(
-    eccn: str,
-    destination_country: str,
-    end_use: str = "",
-    end_user_type: str = "commercial",
-) -> dict[str, Any]:
-    """
-    Evaluate which license exceptions may apply to a specific export transaction.
+# Destinations screened by check_license_exception
+_EMBARGOED_COUNTRIES = frozenset(["CU", "IR", "KP", "SY"])  # E:1 countries
+_RESTRICTED_COUNTRIES = frozenset(["RU", "BY", "CN", "VE"])  # Heavily restricted
+# Exceptions withheld from restricted destinations
+_RESTRICTED_EXCLUDED_EXCEPTIONS = frozenset(["LVS", "GBS", "CIV"])
 
-    Analyzes the ECCN, destination, and end-use to determine which EAR
-    license exceptions might be available. This is an advisory evaluation
-    only - always verify conditions with the actual regulations.
 
-    Args:
-        eccn: Export Control Classification Number (e.g., "3A001", "5A002").
-             Use "EAR99" for items not on the CCL.
-        destination_country: Destination country code (e.g., "DE", "CN") or name.
-        end_use: Description of the intended end-use of the item.
-        end_user_type: Type of end-user. Options:
-                      - "commercial" (default)
-                      - "government"
-                      - "military"
-                      - "individual"
+# Outcomes that count towards a recommended exception
+_USABLE_ELIGIBILITIES = frozenset(
+    [LicenseExceptionEligibility.ELIGIBLE, LicenseExceptionEligibility.MAYBE_ELIGIBLE]
+)
 
-    Returns:
-        Dictionary containing:
-        - eccn: The ECCN checked
-        - destination_country: The destination
-        - exceptions_checked: List of license exceptions evaluated
-        - recommended_exception: Recommended exception if available
-        - requires_license: Whether a license is still required
-        - summary: Summary of the evaluation
-        - warnings: Important warnings or caveats
-    """
+# Caveats attached to every license exception evaluation
+_LICENSE_WARNINGS = (
+    "This evaluation is advisory only - verify all conditions in the actual regulations",
+    "End-user and end-use restrictions apply regardless of license exceptions",
+    "Screen all parties against denied persons and entity lists",
+)
+_MILITARY_END_USE_WARNING = (
+    "Military end-use may trigger additional restrictions under 15 CFR 744.21"
+)
+
+# (eligibility, reason, conditions) for an exception listed on the ECCN
+_ExceptionOutcome = tuple[LicenseExceptionEligibility, str, list[str]]
+
+
+def _check_tmp() -> _ExceptionOutcome:
+    """Evaluate License Exception TMP (temporary exports)."""
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        "TMP may be available for temporary exports",
+        [
+            "Item must be returned within specified timeframe",
+            "Must maintain effective control of the item",
+            "Proper documentation required",
+        ],
+    )
+
+
+def _check_tsu() -> _ExceptionOutcome:
+    """Evaluate License Exception TSU (technology and software unrestricted)."""
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        "TSU may be available for publicly available technology",
+        [
+            "Technology must be publicly available",
+            "Not for military end-use in restricted countries",
+        ],
+    )
+
+
+def _check_gov(end_user_type: str) -> _ExceptionOutcome:
+    """Evaluate License Exception GOV, which only covers government end-users."""
+    if end_user_type != "government":
+        return (
+            LicenseExceptionEligibility.NOT_ELIGIBLE,
+            "GOV only available for U.S. government end-users",
+            [],
+        )
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        "GOV may be available for U.S. government activities",
+        [
+            "Must be for official U.S. government use",
+            "Proper authorization from contracting agency required",
+        ],
+    )
+
+
+def _check_lvs() -> _ExceptionOutcome:
+    """Evaluate License Exception LVS (limited value shipments)."""
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        "LVS may be available for shipments under value threshold",
+        [
+            "Total value must be under $1,500 (check specific limits)",
+            "Destination must be in approved country group",
+            "Not for certain sensitive ECCNs",
+        ],
+    )
+
+
+def _check_gbs() -> _ExceptionOutcome:
+    """Evaluate License Exception GBS (Country Group B shipments)."""
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        "GBS may be available for Group B countries",
+        [
+            "Destination must be in Country Group B",
+            "End-user screening required",
+        ],
+    )
+
+
+def _check_other(exc_code: str, cfr: str) -> _ExceptionOutcome:
+    """Evaluate an exception without a specific check, pointing at its CFR section."""
+    return (
+        LicenseExceptionEligibility.MAYBE_ELIGIBLE,
+        f"Exception {exc_code} potentially applicable - verify conditions",
+        [f"Review requirements in {cfr}"],
+    )
+
+
+# Checks whose outcome does not depend on the request. GOV also needs the
+# end-user type, and other codes fall back to _check_other.
+_EXCEPTION_CHECKS: dict[str, Callable[[], _ExceptionOutcome]] = {
+    "TMP": _check_tmp,
+    "TSU": _check_tsu,
+    "LVS": _check_lvs,
+    "GBS": _check_gbs,
+}
+
+
+def _check_exception(
+    exc_code: str, exc_info: dict[str, str], end_user_type: str
+) -> _ExceptionOutcome:
+    """Evaluate an exception listed on the ECCN for a non-excluded destination."""
+    if exc_code == "GOV":
+        return _check_gov(end_user_type)
+    check = _EXCEPTION_CHECKS.get(exc_code)
+    if check is not None:
+        return check()
+    return _check_other(exc_code, exc_info["cfr"])
+
+
+@lru_cache(maxsize=1024)
+def _license_exception_response(
+    eccn: str,
+    destination_country: str,
+    end_use: str,
+    end_user_type: str,
+) -> bytes:
+    """Build the serialized check_license_exception response, cached per input."""
     # Parse ECCN to get available exceptions
     eccn_info = get_eccn(eccn.upper())
     available_exceptions = []
@@ -503,76 +753,33 @@ async def check_license_exception(
     is_restricted = False
 
     # Check country groups
-    if dest_upper in ["CU", "IR", "KP", "SY"]:  # E:1 countries
+    if dest_upper in _EMBARGOED_COUNTRIES:
         is_embargoed = True
-    elif dest_upper in ["RU", "BY", "CN", "VE"]:  # Heavily restricted
+    elif dest_upper in _RESTRICTED_COUNTRIES:
         is_restricted = True
 
     # Evaluate each potentially applicable exception
     exceptions_checked = []
 
-    for exc_code in LICENSE_EXCEPTIONS:
-        exc_info = LICENSE_EXCEPTIONS[exc_code]
-
+    for exc_code, exc_info in LICENSE_EXCEPTIONS.items():
         eligibility = LicenseExceptionEligibility.NOT_APPLICABLE
         reason = ""
-        conditions = []
-        restrictions = []
+        conditions: list[str] = []
+        restrictions: list[str] = []
 
         if exc_code in available_exceptions:
             if is_embargoed:
                 eligibility = LicenseExceptionEligibility.NOT_ELIGIBLE
                 reason = "License exceptions generally not available to embargoed countries"
                 restrictions = [f"Country {dest_upper} is subject to comprehensive embargo"]
-            elif is_restricted and exc_code in ["LVS", "GBS", "CIV"]:
+            elif is_restricted and exc_code in _RESTRICTED_EXCLUDED_EXCEPTIONS:
                 eligibility = LicenseExceptionEligibility.NOT_ELIGIBLE
                 reason = f"Exception {exc_code} not available to this destination"
                 restrictions = [f"Country {dest_upper} is excluded from this exception"]
-            elif exc_code == "TMP":
-                eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                reason = "TMP may be available for temporary exports"
-                conditions = [
-                    "Item must be returned within specified timeframe",
-                    "Must maintain effective control of the item",
-                    "Proper documentation required",
-                ]
-            elif exc_code == "TSU":
-                eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                reason = "TSU may be available for publicly available technology"
-                conditions = [
-                    "Technology must be publicly available",
-                    "Not for military end-use in restricted countries",
-                ]
-            elif exc_code == "GOV":
-                if end_user_type == "government":
-                    eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                    reason = "GOV may be available for U.S. government activities"
-                    conditions = [
-                        "Must be for official U.S. government use",
-                        "Proper authorization from contracting agency required",
-                    ]
-                else:
-                    eligibility = LicenseExceptionEligibility.NOT_ELIGIBLE
-                    reason = "GOV only available for U.S. government end-users"
-            elif exc_code == "LVS":
-                eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                reason = "LVS may be available for shipments under value threshold"
-                conditions = [
-                    "Total value must be under $1,500 (check specific limits)",
-                    "Destination must be in approved country group",
-                    "Not for certain sensitive ECCNs",
-                ]
-            elif exc_code == "GBS":
-                eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                reason = "GBS may be available for Group B countries"
-                conditions = [
-                    "Destination must be in Country Group B",
-                    "End-user screening required",
-                ]
             else:
-                eligibility = LicenseExceptionEligibility.MAYBE_ELIGIBLE
-                reason = f"Exception {exc_code} potentially applicable - verify conditions"
-                conditions = [f"Review requirements in {exc_info['cfr']}"]
+                eligibility, reason, conditions = _check_exception(
+                    exc_code, exc_info, end_user_type
+                )
         else:
             reason = f"Exception {exc_code} not listed as available for ECCN {eccn}"
 
@@ -588,12 +795,7 @@ async def check_license_exception(
         )
 
     # Determine recommendation
-    eligible_exceptions = [
-        e
-        for e in exceptions_checked
-        if e.eligibility
-        in [LicenseExceptionEligibility.ELIGIBLE, LicenseExceptionEligibility.MAYBE_ELIGIBLE]
-    ]
+    eligible_exceptions = [e for e in exceptions_checked if e.eligibility in _USABLE_ELIGIBILITIES]
 
     recommended = None
     requires_license = True
@@ -611,13 +813,9 @@ async def check_license_exception(
         summary = f"License exception {recommended} may be available. Verify all conditions are met before proceeding."
 
     # Warnings
-    warnings = [
-        "This evaluation is advisory only - verify all conditions in the actual regulations",
-        "End-user and end-use restrictions apply regardless of license exceptions",
-        "Screen all parties against denied persons and entity lists",
-    ]
+    warnings = list(_LICENSE_WARNINGS)
     if end_user_type == "military":
-        warnings.append("Military end-use may trigger additional restrictions under 15 CFR 744.21")
+        warnings.append(_MILITARY_END_USE_WARNING)
 
     evaluation = LicenseExceptionEvaluation(
         eccn=eccn,
@@ -631,7 +829,49 @@ async def check_license_exception(
         warnings=warnings,
     )
 
-    return evaluation.to_dict()
+    return orjson.dumps(evaluation.to_dict())
+
+
+@mcp.tool()
+@audit_log
+async def check_license_exception(
+    eccn: str,
+    destination_country: str,
+    end_use: str = "",
+    end_user_type: str = "commercial",
+) -> dict[str, Any]:
+    """
+    Evaluate which license exceptions may apply to a specific export transaction.
+
+    Analyzes the ECCN, destination, and end-use to determine which EAR
+    license exceptions might be available. This is an advisory evaluation
+    only - always verify conditions with the actual regulations.
+
+    Args:
+        eccn: Export Control Classification Number (e.g., "3A001", "5A002").
+             Use "EAR99" for items not on the CCL.
+        destination_country: Destination country code (e.g., "DE", "CN") or name.
+        end_use: Description of the intended end-use of the item.
+        end_user_type: Type of end-user. Options:
+                      - "commercial" (default)
+                      - "government"
+                      - "military"
+                      - "individual"
+
+    Returns:
+        Dictionary containing:
+        - eccn: The ECCN checked
+        - destination_country: The destination
+        - exceptions_checked: List of license exceptions evaluated
+        - recommended_exception: Recommended exception if available
+        - requires_license: Whether a license is still required
+        - summary: Summary of the evaluation
+        - warnings: Important warnings or caveats
+    """
+    result: dict[str, Any] = orjson.loads(
+        _license_exception_response(eccn, destination_country, end_use, end_user_type)
+    )
+    return result
 
 
 @mcp.tool()
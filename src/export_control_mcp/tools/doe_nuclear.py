@@ -4,6 +4,8 @@ Provides tools for 10 CFR 810 queries and DOE nuclear-related
 export control guidance.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from export_control_mcp.audit import audit_log
@@ -18,6 +20,206 @@ from export_control_mcp.resources.doe_nuclear import (
 )
 from export_control_mcp.server import mcp
 
+# Sensitive technology keywords and the indicator reported for each, in
+# report order.  Each keyword is a plain substring test against the
+# lowercased activity description; with this few keywords that beats a
+# single regex pass.
+SENSITIVE_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("enrichment", "Uranium enrichment technology"),
+    ("centrifuge", "Enrichment technology (centrifuge)"),
+    ("gaseous diffusion", "Enrichment technology (gaseous diffusion)"),
+    ("laser isotope", "Enrichment technology (laser)"),
+    ("reprocessing", "Spent fuel reprocessing technology"),
+    ("plutonium separation", "Reprocessing technology"),
+    ("heavy water", "Heavy water production technology"),
+    ("deuterium", "Heavy water related technology"),
+    ("weapons", "Weapons-related (likely prohibited)"),
+    ("classified", "Classified information (outside Part 810 scope)"),
+)
+
+# The same few destinations are looked up over and over.  Callers pass the
+# stripped name so padding variants share an entry; case is left alone
+# because unlisted countries echo the caller's spelling back.  The cached
+# CFR810Country objects are shared and must not be mutated.
+_cfr810_lookup = lru_cache(maxsize=512)(get_cfr810_authorization)
+
+# Upper bound on entries per check_cfr810_*_batch call
+_MAX_BATCH_ITEMS = 50
+
+# Regulation cited in check_cfr810_country responses
+_PART_810_REGULATION = "10 CFR Part 810 - Assistance to Foreign Atomic Energy Activities"
+
+# Date the Appendix A and prohibited country lists were last checked
+_LISTS_AS_OF_DATE = "2025-11-24"
+
+# check_cfr810_country guidance per authorization type
+_COUNTRY_GUIDANCE: dict[CFR810AuthorizationType, str] = {
+    CFR810AuthorizationType.GENERALLY_AUTHORIZED: (
+        "This country is a Generally Authorized Destination under 10 CFR 810 Appendix A. "
+        "Certain nuclear technology assistance activities may proceed without specific "
+        "DOE authorization, but reporting requirements may still apply. "
+        "Consult 10 CFR 810.6 for generally authorized activities and "
+        "coordinate with your export control office."
+    ),
+    CFR810AuthorizationType.PROHIBITED: (
+        "Nuclear technology assistance to this country is PROHIBITED. "
+        "This country is subject to comprehensive U.S. sanctions. "
+        "Do not proceed with any Part 810 activities. "
+        "Contact your export control office immediately if you have questions."
+    ),
+    CFR810AuthorizationType.SPECIFIC_AUTHORIZATION: (
+        "This country requires SPECIFIC AUTHORIZATION from DOE for any Part 810 activities. "
+        "You must submit a request to DOE/NNSA and receive written approval before "
+        "providing any nuclear technology assistance. "
+        "Contact your export control office to initiate the authorization process."
+    ),
+}
+
+# Reasons check_cfr810_activity gives for needing specific authorization
+_DESTINATION_REASONS: dict[CFR810AuthorizationType, str] = {
+    CFR810AuthorizationType.PROHIBITED: "Destination country is prohibited for nuclear cooperation",
+    CFR810AuthorizationType.SPECIFIC_AUTHORIZATION: "Destination country is not in Appendix A",
+}
+
+_SENSITIVE_TECHNOLOGY_REASON = "Activity involves sensitive nuclear technology"
+
+_ACTIVITY_DISCLAIMER = (
+    "This is preliminary guidance only. All Part 810 activities should be "
+    "reviewed by your institution's export control office before proceeding."
+)
+
+_PROHIBITED_RECOMMENDATIONS = (
+    "STOP - This activity is likely prohibited",
+    "Do not proceed without explicit legal guidance",
+    "Contact your export control office immediately",
+)
+
+_SPECIFIC_RECOMMENDATIONS = (
+    "This activity likely requires specific DOE authorization",
+    "Prepare a Part 810 authorization request",
+    "Contact your export control office to initiate the process",
+    "Do not begin the activity until authorization is received",
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    "This activity may be generally authorized under 810.6",
+    "Verify that the activity falls within 810.6 categories",
+    "Ensure reporting requirements are met",
+    "Confirm with your export control office before proceeding",
+)
+
+# check_cfr810_activity recommendations keyed on (destination authorization
+# type, whether sensitive technology indicators were found).  Only a
+# generally authorized destination with no sensitive indicators escapes
+# the specific-authorization path.
+_RECOMMENDATIONS: dict[tuple[CFR810AuthorizationType, bool], tuple[str, ...]] = {
+    (CFR810AuthorizationType.PROHIBITED, False): _PROHIBITED_RECOMMENDATIONS,
+    (CFR810AuthorizationType.PROHIBITED, True): _PROHIBITED_RECOMMENDATIONS,
+    (CFR810AuthorizationType.SPECIFIC_AUTHORIZATION, False): _SPECIFIC_RECOMMENDATIONS,
+    (CFR810AuthorizationType.SPECIFIC_AUTHORIZATION, True): _SPECIFIC_RECOMMENDATIONS,
+    (CFR810AuthorizationType.GENERALLY_AUTHORIZED, False): _GENERAL_RECOMMENDATIONS,
+    (CFR810AuthorizationType.GENERALLY_AUTHORIZED, True): _SPECIFIC_RECOMMENDATIONS,
+}
+
+# check_cfr810_country response fields for an unrecognized country
+_COUNTRY_NOT_FOUND: dict[str, str] = {
+    "error": "Country not found in database",
+    "guidance": "Verify the country name and try again. "
+    "Contact your export control office for assistance.",
+}
+
+# Canonical list_cfr810_countries authorization_type values, reported on error
+_VALID_AUTHORIZATION_TYPES = ("generally_authorized", "prohibited")
+
+# Static parts of the list_cfr810_countries responses.  Values are all
+# strings, so they can be spread into each response without copying.
+_GENERALLY_AUTHORIZED_LIST_INFO: dict[str, str] = {
+    "description": (
+        "Generally Authorized Destinations (10 CFR 810 Appendix A). "
+        "These countries have 123 Agreements with the US and meet policy criteria. "
+        "Certain nuclear technology assistance activities to these countries "
+        "may proceed without specific DOE authorization, though reporting "
+        "requirements typically still apply."
+    ),
+    "as_of_date": _LISTS_AS_OF_DATE,
+    "regulation": "10 CFR 810 Appendix A",
+}
+
+_PROHIBITED_LIST_INFO: dict[str, str] = {
+    "description": (
+        "Prohibited destinations for nuclear technology assistance. "
+        "These countries are subject to comprehensive U.S. sanctions "
+        "that prohibit nuclear cooperation. No Part 810 activities "
+        "are permitted to these destinations."
+    ),
+    "as_of_date": _LISTS_AS_OF_DATE,
+    "regulation": "10 CFR 810; OFAC Comprehensive Sanctions",
+}
+
+_CountryList = tuple[str, Callable[[], list[str]], dict[str, str]]
+
+_GENERALLY_AUTHORIZED_LIST: _CountryList = (
+    "generally_authorized",
+    get_all_generally_authorized,
+    _GENERALLY_AUTHORIZED_LIST_INFO,
+)
+
+# list_cfr810_countries authorization_type values (after lowercasing) mapped
+# to the canonical type, the country list getter and the static fields
+_COUNTRY_LISTS: dict[str, _CountryList] = {
+    "generally_authorized": _GENERALLY_AUTHORIZED_LIST,
+    "appendix_a": _GENERALLY_AUTHORIZED_LIST,
+    "appendix-a": _GENERALLY_AUTHORIZED_LIST,
+    "prohibited": ("prohibited", get_all_prohibited, _PROHIBITED_LIST_INFO),
+}
+
+# Sections of the get_cfr810_activities response.  Each call gets its own
+# copies of the section dicts and key points list.
+_GENERALLY_AUTHORIZED_SECTION: dict[str, Any] = {
+    "description": (
+        "Activities under 10 CFR 810.6 that are generally authorized "
+        "for Appendix A destinations. Even when generally authorized, "
+        "most activities require reporting to DOE."
+    ),
+    "activities": GENERALLY_AUTHORIZED_ACTIVITIES,
+}
+
+_SPECIFIC_AUTHORIZATION_SECTION: dict[str, Any] = {
+    "description": (
+        "Activities under 10 CFR 810.7 that ALWAYS require specific "
+        "DOE authorization, regardless of destination. These include "
+        "sensitive nuclear technologies."
+    ),
+    "activities": SPECIFIC_AUTHORIZATION_ACTIVITIES,
+}
+
+_ACTIVITY_KEY_POINTS = (
+    "Sensitive nuclear technology (enrichment, reprocessing, heavy water) "
+    "always requires specific authorization",
+    "Even generally authorized activities typically require reporting",
+    "Foreign nationals at national labs may trigger deemed export requirements",
+    "Fundamental research exclusion may apply to basic nuclear science",
+    "Always coordinate with your institution's export control office",
+)
+
+
+def _country_status(country: str) -> dict[str, Any]:
+    """Build the check_cfr810_country response for one country."""
+    result = _cfr810_lookup(country.strip())
+
+    if result is None:
+        return {"country": country, **_COUNTRY_NOT_FOUND}
+
+    return {
+        "country": result.name,
+        "iso_code": result.iso_code,
+        "authorization_type": result.authorization_type.value,
+        "has_123_agreement": result.has_123_agreement,
+        "notes": result.notes,
+        "guidance": _COUNTRY_GUIDANCE[result.authorization_type],
+        "regulation": _PART_810_REGULATION,
+    }
+
 
 @mcp.tool()
 @audit_log
@@ -47,49 +249,38 @@ async def check_cfr810_country(country: str) -> dict[str, Any]:
         - notes: Additional context about the authorization status
         - guidance: Recommended next steps based on authorization type
     """
-    result = get_cfr810_authorization(country)
+    return _country_status(country)
 
-    if result is None:
-        return {
-            "country": country,
-            "error": "Country not found in database",
-            "guidance": "Verify the country name and try again. "
-            "Contact your export control office for assistance.",
-        }
 
-    # Build guidance based on authorization type
-    if result.authorization_type == CFR810AuthorizationType.GENERALLY_AUTHORIZED:
-        guidance = (
-            "This country is a Generally Authorized Destination under 10 CFR 810 Appendix A. "
-            "Certain nuclear technology assistance activities may proceed without specific "
-            "DOE authorization, but reporting requirements may still apply. "
-            "Consult 10 CFR 810.6 for generally authorized activities and "
-            "coordinate with your export control office."
-        )
-    elif result.authorization_type == CFR810AuthorizationType.PROHIBITED:
-        guidance = (
-            "Nuclear technology assistance to this country is PROHIBITED. "
-            "This country is subject to comprehensive U.S. sanctions. "
-            "Do not proceed with any Part 810 activities. "
-            "Contact your export control office immediately if you have questions."
-        )
-    else:  # SPECIFIC_AUTHORIZATION
-        guidance = (
-            "This country requires SPECIFIC AUTHORIZATION from DOE for any Part 810 activities. "
-            "You must submit a request to DOE/NNSA and receive written approval before "
-            "providing any nuclear technology assistance. "
-            "Contact your export control office to initiate the authorization process."
-        )
+def _batch_too_large(count: int) -> dict[str, Any]:
+    """Build the error entry returned for an oversized batch."""
+    return {"error": f"At most {_MAX_BATCH_ITEMS} entries can be checked per call, got {count}."}
 
-    return {
-        "country": result.name,
-        "iso_code": result.iso_code,
-        "authorization_type": result.authorization_type.value,
-        "has_123_agreement": result.has_123_agreement,
-        "notes": result.notes,
-        "guidance": guidance,
-        "regulation": "10 CFR Part 810 - Assistance to Foreign Atomic Energy Activities",
-    }
+
+@mcp.tool()
+@audit_log
+async def check_cfr810_country_batch(countries: list[str]) -> list[dict[str, Any]]:
+    """
+    Check 10 CFR 810 authorization status for several countries in one call.
+
+    Runs the same lookup as check_cfr810_country on each country, so every
+    result matches what that tool returns for the country on its own.
+    Useful for vetting a list of destinations or the nationalities of a
+    group of visitors without one round trip per country.
+
+    Args:
+        countries: Country names to check (at most 50). The same name
+                   variations as check_cfr810_country are supported.
+
+    Returns:
+        List of results in the same order as countries, each with the fields
+        returned by check_cfr810_country. If more than 50 countries are
+        given, a single entry with an "error" key.
+    """
+    if len(countries) > _MAX_BATCH_ITEMS:
+        return [_batch_too_large(len(countries))]
+
+    return [_country_status(country) for country in countries]
 
 
 @mcp.tool()
@@ -119,45 +310,22 @@ async def list_cfr810_countries(
         - description: Explanation of what this category means
         - as_of_date: Date the list was last updated
     """
-    auth_type = authorization_type.lower().strip()
-
-    if auth_type in ("generally_authorized", "appendix_a", "appendix-a"):
-        countries = get_all_generally_authorized()
-        return {
-            "authorization_type": "generally_authorized",
-            "count": len(countries),
-            "countries": countries,
-            "description": (
-                "Generally Authorized Destinations (10 CFR 810 Appendix A). "
-                "These countries have 123 Agreements with the US and meet policy criteria. "
-                "Certain nuclear technology assistance activities to these countries "
-                "may proceed without specific DOE authorization, though reporting "
-                "requirements typically still apply."
-            ),
-            "as_of_date": "2025-11-24",
-            "regulation": "10 CFR 810 Appendix A",
-        }
-    elif auth_type == "prohibited":
-        countries = get_all_prohibited()
-        return {
-            "authorization_type": "prohibited",
-            "count": len(countries),
-            "countries": countries,
-            "description": (
-                "Prohibited destinations for nuclear technology assistance. "
-                "These countries are subject to comprehensive U.S. sanctions "
-                "that prohibit nuclear cooperation. No Part 810 activities "
-                "are permitted to these destinations."
-            ),
-            "as_of_date": "2025-11-24",
-            "regulation": "10 CFR 810; OFAC Comprehensive Sanctions",
-        }
-    else:
+    country_list = _COUNTRY_LISTS.get(authorization_type.lower().strip())
+    if country_list is None:
         return {
             "error": f"Unknown authorization_type: {authorization_type}",
-            "valid_options": ["generally_authorized", "prohibited"],
+            "valid_options": list(_VALID_AUTHORIZATION_TYPES),
         }
 
+    list_type, get_countries, list_info = country_list
+    countries = get_countries()
+    return {
+        "authorization_type": list_type,
+        "count": len(countries),
+        "countries": countries,
+        **list_info,
+    }
+
 
 @mcp.tool()
 @audit_log
@@ -181,31 +349,52 @@ async def get_cfr810_activities() -> dict[str, Any]:
         - national_lab_guidance: Guidance specific to national laboratory operations
     """
     return {
-        "generally_authorized_activities": {
-            "description": (
-                "Activities under 10 CFR 810.6 that are generally authorized "
-                "for Appendix A destinations. Even when generally authorized, "
-                "most activities require reporting to DOE."
-            ),
-            "activities": GENERALLY_AUTHORIZED_ACTIVITIES,
-        },
-        "specific_authorization_activities": {
-            "description": (
-                "Activities under 10 CFR 810.7 that ALWAYS require specific "
-                "DOE authorization, regardless of destination. These include "
-                "sensitive nuclear technologies."
-            ),
-            "activities": SPECIFIC_AUTHORIZATION_ACTIVITIES,
-        },
+        "generally_authorized_activities": dict(_GENERALLY_AUTHORIZED_SECTION),
+        "specific_authorization_activities": dict(_SPECIFIC_AUTHORIZATION_SECTION),
         "national_lab_guidance": NATIONAL_LAB_GUIDANCE,
-        "key_points": [
-            "Sensitive nuclear technology (enrichment, reprocessing, heavy water) "
-            "always requires specific authorization",
-            "Even generally authorized activities typically require reporting",
-            "Foreign nationals at national labs may trigger deemed export requirements",
-            "Fundamental research exclusion may apply to basic nuclear science",
-            "Always coordinate with your institution's export control office",
-        ],
+        "key_points": list(_ACTIVITY_KEY_POINTS),
+    }
+
+
+def _activity_analysis(activity_description: str, destination_country: str) -> dict[str, Any]:
+    """Build the check_cfr810_activity response for one activity."""
+    # Check country status first
+    country_result = _cfr810_lookup(destination_country.strip())
+
+    if country_result is None:
+        return {
+            "error": f"Country not recognized: {destination_country}",
+            "guidance": "Please verify the country name and try again.",
+        }
+
+    # Check for sensitive technology indicators
+    activity_lower = activity_description.lower()
+    sensitive_indicators = [
+        description for keyword, description in SENSITIVE_KEYWORDS if keyword in activity_lower
+    ]
+
+    # Specific authorization is likely required if there is any reason for it
+    reasons = []
+    destination_reason = _DESTINATION_REASONS.get(country_result.authorization_type)
+    if destination_reason is not None:
+        reasons.append(destination_reason)
+    if sensitive_indicators:
+        reasons.append(_SENSITIVE_TECHNOLOGY_REASON)
+    likely_requires_specific = bool(reasons)
+
+    recommendations = list(
+        _RECOMMENDATIONS[country_result.authorization_type, bool(sensitive_indicators)]
+    )
+
+    return {
+        "activity_description": activity_description,
+        "destination_country": country_result.name,
+        "country_authorization_type": country_result.authorization_type.value,
+        "sensitive_indicators": sensitive_indicators,
+        "likely_requires_specific_authorization": likely_requires_specific,
+        "reasons": reasons,
+        "recommendations": recommendations,
+        "disclaimer": _ACTIVITY_DISCLAIMER,
     }
 
 
@@ -238,85 +427,42 @@ async def check_cfr810_activity(
         - sensitive_indicators: Any sensitive technology indicators detected
         - recommendations: Suggested next steps
     """
-    # Check country status first
-    country_result = get_cfr810_authorization(destination_country)
+    return _activity_analysis(activity_description, destination_country)
 
-    if country_result is None:
-        return {
-            "error": f"Country not recognized: {destination_country}",
-            "guidance": "Please verify the country name and try again.",
-        }
-
-    # Check for sensitive technology indicators
-    activity_lower = activity_description.lower()
-    sensitive_indicators = []
-
-    sensitive_keywords = {
-        "enrichment": "Uranium enrichment technology",
-        "centrifuge": "Enrichment technology (centrifuge)",
-        "gaseous diffusion": "Enrichment technology (gaseous diffusion)",
-        "laser isotope": "Enrichment technology (laser)",
-        "reprocessing": "Spent fuel reprocessing technology",
-        "plutonium separation": "Reprocessing technology",
-        "heavy water": "Heavy water production technology",
-        "deuterium": "Heavy water related technology",
-        "weapons": "Weapons-related (likely prohibited)",
-        "classified": "Classified information (outside Part 810 scope)",
-    }
 
-    for keyword, description in sensitive_keywords.items():
-        if keyword in activity_lower:
-            sensitive_indicators.append(description)
-
-    # Determine if specific authorization likely required
-    likely_requires_specific = False
-    reasons = []
+@mcp.tool()
+@audit_log
+async def check_cfr810_activity_batch(
+    activities: list[dict[str, str]],
+) -> list[dict[str, Any]]:
+    """
+    Analyze several nuclear technology activities for 10 CFR 810 requirements.
 
-    # Check destination
-    if country_result.authorization_type == CFR810AuthorizationType.PROHIBITED:
-        likely_requires_specific = True
-        reasons.append("Destination country is prohibited for nuclear cooperation")
-    elif country_result.authorization_type == CFR810AuthorizationType.SPECIFIC_AUTHORIZATION:
-        likely_requires_specific = True
-        reasons.append("Destination country is not in Appendix A")
+    Runs the same analysis as check_cfr810_activity on each entry, so every
+    result matches what that tool returns for the activity on its own.
 
-    # Check for sensitive technology
-    if sensitive_indicators:
-        likely_requires_specific = True
-        reasons.append("Activity involves sensitive nuclear technology")
-
-    # Build recommendations
-    if country_result.authorization_type == CFR810AuthorizationType.PROHIBITED:
-        recommendations = [
-            "STOP - This activity is likely prohibited",
-            "Do not proceed without explicit legal guidance",
-            "Contact your export control office immediately",
-        ]
-    elif likely_requires_specific:
-        recommendations = [
-            "This activity likely requires specific DOE authorization",
-            "Prepare a Part 810 authorization request",
-            "Contact your export control office to initiate the process",
-            "Do not begin the activity until authorization is received",
-        ]
-    else:
-        recommendations = [
-            "This activity may be generally authorized under 810.6",
-            "Verify that the activity falls within 810.6 categories",
-            "Ensure reporting requirements are met",
-            "Confirm with your export control office before proceeding",
-        ]
+    Args:
+        activities: Activities to analyze (at most 50). Each entry needs an
+            "activity_description" and a "destination_country", with the
+            same meaning as the check_cfr810_activity arguments.
 
-    return {
-        "activity_description": activity_description,
-        "destination_country": country_result.name,
-        "country_authorization_type": country_result.authorization_type.value,
-        "sensitive_indicators": sensitive_indicators,
-        "likely_requires_specific_authorization": likely_requires_specific,
-        "reasons": reasons,
-        "recommendations": recommendations,
-        "disclaimer": (
-            "This is preliminary guidance only. All Part 810 activities should be "
-            "reviewed by your institution's export control office before proceeding."
-        ),
-    }
+    Returns:
+        List of analyses in the same order as activities, each with the
+        fields returned by check_cfr810_activity. Entries missing either key
+        get an "error" result. If more than 50 activities are given, a single
+        entry with an "error" key.
+    """
+    if len(activities) > _MAX_BATCH_ITEMS:
+        return [_batch_too_large(len(activities))]
+
+    results = []
+    for activity in activities:
+        description = activity.get("activity_description")
+        country = activity.get("destination_country")
+        if description is None or country is None:
+            results.append(
+                {"error": "Each activity needs activity_description and destination_country"}
+            )
+        else:
+            results.append(_activity_analysis(description, country))
+    return results
@@ -4,6 +4,7 @@ Provides semantic search capabilities for EAR and ITAR regulations,
 ECCN lookups, USML category information, and jurisdiction analysis.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from export_control_mcp.audit import audit_log
@@ -11,6 +12,7 @@ from export_control_mcp.models.regulations import (
     ECCN,
     JurisdictionAnalysis,
     RegulationType,
+    SearchResult,
 )
 from export_control_mcp.resources.reference_data import (
     LICENSE_EXCEPTIONS,
@@ -22,6 +24,101 @@ from export_control_mcp.resources.reference_data import (
 from export_control_mcp.server import mcp
 from export_control_mcp.services import get_rag_service
 
+# search_regulations filter values, keyed by lowercased name
+_REGULATION_TYPES = {t.value: t for t in RegulationType}
+
+# Keywords suggesting ITAR or EAR jurisdiction, each paired with the
+# indicator reported when an item description contains it
+_MILITARY_INDICATORS: tuple[tuple[str, str], ...] = tuple(
+    (keyword, f"Contains military-related term: '{keyword}'")
+    for keyword in (
+        "military",
+        "defense",
+        "weapon",
+        "munition",
+        "combat",
+        "tactical",
+        "warfighting",
+        "ordnance",
+        "ammunition",
+        "missile",
+        "spacecraft",
+        "satellite",
+        "classified",
+    )
+)
+
+_COMMERCIAL_INDICATORS: tuple[tuple[str, str], ...] = tuple(
+    (keyword, f"Contains commercial/dual-use term: '{keyword}'")
+    for keyword in (
+        "commercial",
+        "civilian",
+        "industrial",
+        "consumer",
+        "telecommunications",
+        "computer",
+        "software",
+        "encryption",
+    )
+)
+
+# Listed in the error returned for an unknown license exception code
+_AVAILABLE_LICENSE_EXCEPTIONS = ", ".join(sorted(LICENSE_EXCEPTIONS))
+
+# compare_jurisdictions next steps, keyed by likely jurisdiction
+_GENERAL_NEXT_STEPS = (
+    "Consult with your Export Control Officer for formal classification",
+    "Gather complete technical specifications and intended end-use",
+)
+_CJ_REQUEST_STEP = "Consider submitting a Commodity Jurisdiction (CJ) request to DDTC"
+_ECCN_REQUEST_STEP = "Consider requesting a formal ECCN classification from BIS"
+_NEXT_STEPS: dict[str, tuple[str, ...]] = {
+    "ITAR": (*_GENERAL_NEXT_STEPS, _CJ_REQUEST_STEP),
+    "EAR": (*_GENERAL_NEXT_STEPS, _ECCN_REQUEST_STEP),
+    "Dual-Use": (*_GENERAL_NEXT_STEPS, _CJ_REQUEST_STEP, _ECCN_REQUEST_STEP),
+    "Unknown": _GENERAL_NEXT_STEPS,
+}
+
+
+def _search_indicators(results: list[SearchResult], regulation: str) -> list[str]:
+    """Jurisdiction indicators from the search hits for one regulation."""
+    if not results:
+        return []
+    return [
+        f"Found {len(results)} relevant {regulation} provisions",
+        # Cite the top results that scored highly
+        *(f"High relevance to {r.chunk.citation}" for r in results[:3] if r.score > 0.5),
+    ]
+
+
+@lru_cache(maxsize=128)
+def _license_implications(groups: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Derive licensing implications and notes from country group memberships.
+
+    Countries share a small number of group combinations, so each
+    combination is only evaluated once.
+    """
+    implications = []
+    notes = []
+
+    if any(g.startswith("E:") for g in groups):
+        implications.append("Subject to comprehensive embargo - most exports prohibited")
+        notes.append("Consult OFAC sanctions requirements in addition to EAR")
+    elif any(g.startswith("D:") for g in groups):
+        implications.append("Enhanced license requirements for national security items")
+        if "D:5" in groups:
+            implications.append("U.S. arms embargo applies")
+
+    if "A:1" in groups:
+        implications.append("Favorable treatment under Wassenaar Arrangement")
+    if "A:5" in groups:
+        implications.append("Favorable treatment for encryption items")
+    if "B" in groups:
+        implications.append("Generally permissive - many license exceptions available")
+
+    return tuple(implications), tuple(notes)
+
 
 @mcp.tool()
 @audit_log
@@ -193,13 +290,8 @@ async def search_regulations(
     """
     rag_service = get_rag_service()
 
-    # Handle regulation type filter
-    reg_type = None
-    if regulation_type.lower() == "ear":
-        reg_type = RegulationType.EAR
-    elif regulation_type.lower() == "itar":
-        reg_type = RegulationType.ITAR
-    # else: None searches both
+    # Handle regulation type filter; None ("all" or unknown) searches both
+    reg_type = _REGULATION_TYPES.get(regulation_type.lower())
 
     # Clamp limit to reasonable range
     limit = max(1, min(limit, 50))
@@ -339,9 +431,8 @@ async def compare_jurisdictions(
     """
     rag_service = get_rag_service()
 
-    # Search both regulations
-    ear_results = await rag_service.search_ear(query=item_description, limit=5)
-    itar_results = await rag_service.search_itar(query=item_description, limit=5)
+    # Search both regulations, embedding the description once
+    ear_results, itar_results = await rag_service.search_both(item_description, limit=5)
 
     # Analyze indicators
     ear_indicators: list[str] = []
@@ -349,57 +440,19 @@ async def compare_jurisdictions(
     suggested_eccns: list[str] = []
     suggested_usml_categories: list[str] = []
 
-    # Check for military/defense keywords suggesting ITAR
-    military_keywords = [
-        "military",
-        "defense",
-        "weapon",
-        "munition",
-        "combat",
-        "tactical",
-        "warfighting",
-        "ordnance",
-        "ammunition",
-        "missile",
-        "spacecraft",
-        "satellite",
-        "classified",
-    ]
+    # Check for military/defense keywords suggesting ITAR and
+    # commercial/dual-use keywords suggesting EAR
     description_lower = item_description.lower()
-
-    for keyword in military_keywords:
-        if keyword in description_lower:
-            itar_indicators.append(f"Contains military-related term: '{keyword}'")
-
-    # Check for commercial/dual-use keywords suggesting EAR
-    commercial_keywords = [
-        "commercial",
-        "civilian",
-        "industrial",
-        "consumer",
-        "telecommunications",
-        "computer",
-        "software",
-        "encryption",
-    ]
-
-    for keyword in commercial_keywords:
-        if keyword in description_lower:
-            ear_indicators.append(f"Contains commercial/dual-use term: '{keyword}'")
+    itar_indicators.extend(
+        indicator for keyword, indicator in _MILITARY_INDICATORS if keyword in description_lower
+    )
+    ear_indicators.extend(
+        indicator for keyword, indicator in _COMMERCIAL_INDICATORS if keyword in description_lower
+    )
 
     # Analyze search results for jurisdiction hints
-    if ear_results:
-        ear_indicators.append(f"Found {len(ear_results)} relevant EAR provisions")
-        # Extract potential ECCNs from high-scoring results
-        for r in ear_results[:3]:
-            if r.score > 0.5:
-                ear_indicators.append(f"High relevance to {r.chunk.citation}")
-
-    if itar_results:
-        itar_indicators.append(f"Found {len(itar_results)} relevant ITAR provisions")
-        for r in itar_results[:3]:
-            if r.score > 0.5:
-                itar_indicators.append(f"High relevance to {r.chunk.citation}")
+    ear_indicators.extend(_search_indicators(ear_results, "EAR"))
+    itar_indicators.extend(_search_indicators(itar_results, "ITAR"))
 
     # Determine likely jurisdiction
     ear_score = len(ear_indicators)
@@ -440,15 +493,7 @@ async def compare_jurisdictions(
     )
 
     # Recommended next steps
-    next_steps = [
-        "Consult with your Export Control Officer for formal classification",
-        "Gather complete technical specifications and intended end-use",
-    ]
-
-    if likely_jurisdiction == "ITAR" or likely_jurisdiction == "Dual-Use":
-        next_steps.append("Consider submitting a Commodity Jurisdiction (CJ) request to DDTC")
-    if likely_jurisdiction == "EAR" or likely_jurisdiction == "Dual-Use":
-        next_steps.append("Consider requesting a formal ECCN classification from BIS")
+    next_steps = list(_NEXT_STEPS[likely_jurisdiction])
 
     # Build result
     result = JurisdictionAnalysis(
@@ -549,10 +594,9 @@ async def get_license_exception_info(exception_code: str) -> dict[str, Any]:
     code_upper = exception_code.upper().strip()
 
     if code_upper not in LICENSE_EXCEPTIONS:
-        available = ", ".join(sorted(LICENSE_EXCEPTIONS.keys()))
         return {
             "error": f"License exception '{exception_code}' not found.",
-            "available_exceptions": available,
+            "available_exceptions": _AVAILABLE_LICENSE_EXCEPTIONS,
         }
 
     exception_data = LICENSE_EXCEPTIONS[code_upper]
@@ -607,28 +651,11 @@ async def get_country_group_info(country: str) -> dict[str, Any]:
             "suggestion": "Try using the full country name or ISO 3166-1 alpha-2 code.",
         }
 
-    # Determine license implications based on groups
-    implications = []
-    notes = []
-
-    if any(g.startswith("E:") for g in groups):
-        implications.append("Subject to comprehensive embargo - most exports prohibited")
-        notes.append("Consult OFAC sanctions requirements in addition to EAR")
-    elif any(g.startswith("D:") for g in groups):
-        implications.append("Enhanced license requirements for national security items")
-        if "D:5" in groups:
-            implications.append("U.S. arms embargo applies")
-
-    if "A:1" in groups:
-        implications.append("Favorable treatment under Wassenaar Arrangement")
-    if "A:5" in groups:
-        implications.append("Favorable treatment for encryption items")
-    if "B" in groups:
-        implications.append("Generally permissive - many license exceptions available")
+    implications, notes = _license_implications(tuple(groups))
 
     return {
         "country": country,
         "groups": groups,
-        "license_implications": implications,
-        "notes": notes,
+        "license_implications": list(implications),
+        "notes": list(notes),
     }
@@ -20,6 +20,9 @@ from export_control_mcp.resources.country_sanctions import (
 from export_control_mcp.server import mcp
 from export_control_mcp.services import get_sanctions_db
 
+# search_sdn_list entity_type filter values, keyed by lowercased name
+_ENTITY_TYPES = {t.value: t for t in EntityType}
+
 
 def _initialize_country_sanctions() -> None:
     """Initialize country sanctions data in the database."""
@@ -79,7 +82,7 @@ async def search_entity_list(
     fuzzy_threshold = max(0.0, min(1.0, fuzzy_threshold))
     limit = max(1, min(100, limit))
 
-    results = db.search_entity_list(
+    results = await db.asearch_entity_list(
         query=query,
         country=country,
         fuzzy_threshold=fuzzy_threshold,
@@ -140,19 +143,14 @@ async def search_sdn_list(
     """
     db = get_sanctions_db()
 
-    # Parse entity type
-    sdn_type = None
-    if entity_type:
-        try:
-            sdn_type = EntityType(entity_type.lower())
-        except ValueError:
-            pass
+    # Parse entity type; an unknown type searches all types
+    sdn_type = _ENTITY_TYPES.get(entity_type.lower()) if entity_type else None
 
     # Clamp parameters
     fuzzy_threshold = max(0.0, min(1.0, fuzzy_threshold))
     limit = max(1, min(100, limit))
 
-    results = db.search_sdn_list(
+    results = await db.asearch_sdn_list(
         query=query,
         sdn_type=sdn_type,
         program=program,
@@ -200,7 +198,7 @@ async def search_denied_persons(
     fuzzy_threshold = max(0.0, min(1.0, fuzzy_threshold))
     limit = max(1, min(100, limit))
 
-    results = db.search_denied_persons(
+    results = await db.asearch_denied_persons(
         query=query,
         fuzzy_threshold=fuzzy_threshold,
         limit=limit,
@@ -255,12 +253,12 @@ async def check_country_sanctions(country: str) -> dict[str, Any]:
         if result:
             return result.to_dict()
 
-    # Try by name in database
+    # Try by name in database, so ingested data wins over the bundled JSON
     result = db.get_country_by_name(country)
     if result:
         return result.to_dict()
 
-    # Check preloaded data by name
+    # Check preloaded data by exact name or alias, then by partial name
     result = _get_country_by_name(country)
     if result:
         return result.to_dict()
@@ -356,7 +354,7 @@ async def search_consolidated_screening_list(
             }
         ]
 
-    results = db.search_csl(
+    results = await db.asearch_csl(
         query=query,
         source_list=source_list,
         country=country,
@@ -38,7 +38,9 @@ def vector_store(temp_chroma_path):
     """Vector store with temporary storage."""
     from export_control_mcp.services.vector_store import VectorStoreService
 
-    return VectorStoreService(db_path=str(temp_chroma_path))
+    store = VectorStoreService(db_path=str(temp_chroma_path))
+    yield store
+    store.close()
 
 
 @pytest.fixture
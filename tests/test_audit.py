@@ -312,6 +312,24 @@ class TestWriteAuditLog:
                 # Assert
                 assert log_path.exists()
 
+    def test_should_recreate_removed_log_directory(self) -> None:
+        """Test that the log directory is recreated if removed between writes."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "logs" / "audit.jsonl"
+
+            with patch("export_control_mcp.audit.settings") as mock_settings:
+                mock_settings.audit_log_path = str(log_path)
+                _write_audit_log({"tool": "first"})
+                log_path.unlink()
+                log_path.parent.rmdir()
+
+                # Act
+                _write_audit_log({"tool": "second"})
+
+                # Assert
+                assert json.loads(log_path.read_text())["tool"] == "second"
+
     def test_should_raise_audit_log_error_on_failure(self) -> None:
         """Test that AuditLogError is raised on write failure."""
         # Arrange
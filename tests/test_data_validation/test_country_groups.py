@@ -225,3 +225,8 @@ class TestCountryLookup:
         groups = get_country_groups("Iran")
         assert "E:1" in groups, "Iran should be in E:1 (terrorism)"
         assert "D:4" in groups, "Iran should be in D:4 (missile)"
+
+    def test_lookup_returns_independent_list(self):
+        """Modifying a returned list should not affect later lookups."""
+        get_country_groups("Germany").clear()
+        assert "A:1" in get_country_groups("Germany")
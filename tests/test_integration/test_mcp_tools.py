@@ -46,6 +46,7 @@ class TestMCPToolRegistration:
         tool_names = list(tools.keys())
 
         assert "suggest_classification" in tool_names
+        assert "suggest_classification_batch" in tool_names
 
     @pytest.mark.asyncio
     async def test_should_register_doe_nuclear_tools(self) -> None:
@@ -54,7 +55,9 @@ class TestMCPToolRegistration:
         tool_names = list(tools.keys())
 
         assert "check_cfr810_country" in tool_names
+        assert "check_cfr810_country_batch" in tool_names
         assert "get_cfr810_activities" in tool_names
+        assert "check_cfr810_activity_batch" in tool_names
 
     @pytest.mark.asyncio
     async def test_should_have_tool_descriptions(self) -> None:
@@ -367,6 +370,39 @@ class TestMCPToolOutputFormat:
             assert "authorization_type" in result
             assert "guidance" in result
 
+    @pytest.mark.asyncio
+    async def test_cfr810_country_batch_should_match_single_checks(self) -> None:
+        """Test that CFR810 batch country results equal per-country checks, in order."""
+        tools = await mcp.get_tools()
+        single = tools["check_cfr810_country"]
+        batch = tools["check_cfr810_country_batch"]
+        countries = ["France", "Iran", "China", "France"]
+
+        results = await batch.fn(countries=countries)
+
+        assert len(results) == len(countries)
+        for country, result in zip(countries, results, strict=True):
+            assert result == await single.fn(country=country)
+
+    @pytest.mark.asyncio
+    async def test_cfr810_activity_batch_should_flag_incomplete_entries(self) -> None:
+        """Test that CFR810 activity batch analyzes each entry and flags bad ones."""
+        tools = await mcp.get_tools()
+        batch = tools["check_cfr810_activity_batch"]
+
+        results = await batch.fn(
+            activities=[
+                {
+                    "activity_description": "Centrifuge design review",
+                    "destination_country": "Japan",
+                },
+                {"activity_description": "Reactor safety training"},
+            ]
+        )
+
+        assert results[0]["likely_requires_specific_authorization"] is True
+        assert "error" in results[1]
+
 
 class TestMCPServerConfiguration:
     """Tests for MCP server configuration."""
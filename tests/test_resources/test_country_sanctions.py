@@ -162,6 +162,25 @@ class TestGetCountrySanctions:
         assert result is None
 
 
+class TestCountrySanctionsToDict:
+    """Tests for serializing preloaded country sanctions."""
+
+    def test_should_not_share_lists_with_preloaded_data(self) -> None:
+        """Test that modifying a returned dict does not change the preloaded data."""
+        # Arrange
+        result = get_country_sanctions("IR")
+        assert result is not None
+
+        # Act
+        response = result.to_dict()
+        response["ofac_programs"].append("MODIFIED")
+        response["notes"].clear()
+
+        # Assert
+        assert "MODIFIED" not in result.ofac_programs
+        assert result.to_dict()["notes"]
+
+
 class TestGetCountryByName:
     """Tests for getting sanctions by country name."""
 
@@ -200,6 +219,15 @@ class TestGetCountryByName:
         # Assert
         assert result is None
 
+    def test_should_find_country_by_alias(self) -> None:
+        """Test finding country by a common alternative name."""
+        # Act
+        result = get_country_by_name(" DPRK ")
+
+        # Assert
+        assert result is not None
+        assert result.country_code == "KP"
+
 
 class TestReloadCountrySanctionsData:
     """Tests for cache clearing and reload."""
@@ -101,6 +101,14 @@ class TestCSLDatabaseOperations:
         assert len(results) >= 1
         assert any("Acme" in r["name"] for r in results)
 
+    def test_fuzzy_match_returns_full_entry(self, temp_csl_db, sample_csl_entries):
+        """Test that fuzzy fallback hits are hydrated with all columns."""
+        results = temp_csl_db.search_csl("Acme Defence Industries", fuzzy_threshold=0.8)
+        match = next(r for r in results if r["id"] == "CSL-001")
+        assert match["match_type"] == "fuzzy_name"
+        assert match["addresses"] == ["123 Main St, Beijing, China"]
+        assert match["remarks"] == "Added for missile technology concerns"
+
     def test_search_csl_partial_match(self, temp_csl_db, sample_csl_entries):
         """Test partial name matching."""
         results = temp_csl_db.search_csl("Tehran")
@@ -115,6 +123,83 @@ class TestCSLDatabaseOperations:
         for r in results:
             assert r["source_list"] == "sdn"
 
+    def test_typo_found_by_fuzzy_fallback(self, temp_csl_db, sample_csl_entries):
+        """Test that a transposition typo is matched by the fuzzy fallback."""
+        results = temp_csl_db.search_csl("Glboal Shiping LLC")
+        assert [r["id"] for r in results] == ["CSL-004"]
+        assert results[0]["match_type"] == "fuzzy_name"
+
+    def test_fuzzy_match_without_shared_trigram(self, temp_csl_db):
+        """Test that a close name sharing no trigram with the query is matched."""
+        temp_csl_db.add_csl_entry(
+            entry_id="CSL-SMYTH", name="Smyth", entry_type="individual", source_list="sdn"
+        )
+        temp_csl_db.add_csl_entry(
+            entry_id="CSL-OTHER", name="Orion Trading", entry_type="entity", source_list="sdn"
+        )
+        results = temp_csl_db.search_csl("Smith", fuzzy_threshold=0.7)
+        assert [r["id"] for r in results] == ["CSL-SMYTH"]
+        assert results[0]["match_score"] == pytest.approx(0.8)
+
+    def test_search_csl_by_country(self, temp_csl_db, sample_csl_entries):
+        """Test case-insensitive country filtering in FTS and fuzzy phases."""
+        results = temp_csl_db.search_csl("Acme Defense", country="china")
+        assert any(r["id"] == "CSL-001" for r in results)
+
+        results = temp_csl_db.search_csl("Acme Defence Industries", country="CHINA")
+        assert any(r["id"] == "CSL-001" for r in results)
+
+        results = temp_csl_db.search_csl("Acme Defense", country="Russia")
+        assert all(r["id"] != "CSL-001" for r in results)
+
+    def test_country_filter_follows_updates(self, temp_csl_db, sample_csl_entries):
+        """Test that re-adding an entry with new countries updates the filter."""
+        entry = dict(sample_csl_entries[0], countries=["Russia"])
+        temp_csl_db.add_csl_entry(**entry)
+
+        assert temp_csl_db.search_csl("Acme Defense", country="China") == []
+        results = temp_csl_db.search_csl("Acme Defense", country="Russia")
+        assert any(r["id"] == "CSL-001" for r in results)
+
+    def test_existing_database_gets_country_rowid_index(self, tmp_path):
+        """Test that reopening a database adds the csl_countries rowid index."""
+        db_path = str(tmp_path / "existing.db")
+        db = SanctionsDBService(db_path)
+        conn = db._get_connection()
+        conn.execute("DROP INDEX ix_csl_countries_rowid")
+        conn.commit()
+        db.close()
+
+        db = SanctionsDBService(db_path)
+        index = (
+            db._get_connection()
+            .execute("SELECT 1 FROM sqlite_master WHERE name = 'ix_csl_countries_rowid'")
+            .fetchone()
+        )
+        db.close()
+        assert index is not None
+
+    def test_existing_database_drops_trigram_index(self, tmp_path):
+        """Test that reopening a database drops the old CSL trigram index."""
+        db_path = str(tmp_path / "existing.db")
+        db = SanctionsDBService(db_path)
+        conn = db._get_connection()
+        conn.execute(
+            "CREATE VIRTUAL TABLE csl_trigram USING fts5("
+            "name, aliases, content='csl', content_rowid='rowid', tokenize='trigram')"
+        )
+        conn.commit()
+        db.close()
+
+        db = SanctionsDBService(db_path)
+        leftover = (
+            db._get_connection()
+            .execute("SELECT name FROM sqlite_master WHERE name LIKE 'csl_trigram%'")
+            .fetchall()
+        )
+        db.close()
+        assert leftover == []
+
     def test_search_csl_no_results(self, temp_csl_db, sample_csl_entries):
         """Test search with no matching results."""
         results = temp_csl_db.search_csl("Nonexistent Company XYZ123")
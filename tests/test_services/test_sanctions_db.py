@@ -1,5 +1,6 @@
 """Tests for the sanctions database service."""
 
+import sqlite3
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -107,6 +108,27 @@ class TestEntityListOperations:
 
         assert len(results) > 0
 
+    def test_reinsert_unchanged_entry_is_noop(self, temp_db, sample_entity):
+        """Test that re-adding an identical entry does not rewrite the row."""
+        conn = temp_db._get_connection()
+        changes_before = conn.total_changes
+
+        temp_db.add_entity_list_entry(sample_entity)
+
+        assert conn.total_changes == changes_before
+
+    def test_update_entry_reindexes_name(self, temp_db, sample_entity):
+        """Test that changing an entry's name updates FTS and other columns."""
+        renamed = sample_entity.model_copy(
+            update={"name": "Renamed Holdings", "addresses": ["1 New Road"]}
+        )
+        temp_db.add_entity_list_entry(renamed)
+
+        results = temp_db.search_entity_list("Renamed Holdings")
+        assert results[0].entry.id == sample_entity.id
+        assert results[0].entry.addresses == ["1 New Road"]
+        assert temp_db.get_stats()["entity_list"] == 1
+
 
 class TestSDNListOperations:
     """Tests for SDN List database operations."""
@@ -134,6 +156,14 @@ class TestSDNListOperations:
         results = temp_db.search_sdn_list("Test", program="CUBA")
         assert len(results) == 0
 
+    def test_fuzzy_search_by_program(self, temp_db, sample_sdn):
+        """Test that the program filter applies to fuzzy matches."""
+        results = temp_db.search_sdn_list("Test Bank Internatonal", program="SDGT")
+        assert [r.match_type for r in results] == ["fuzzy_name"]
+
+        results = temp_db.search_sdn_list("Test Bank Internatonal", program="IRA")
+        assert len(results) == 0
+
 
 class TestDeniedPersonsOperations:
     """Tests for Denied Persons List database operations."""
@@ -151,6 +181,15 @@ class TestDeniedPersonsOperations:
 
         assert len(results) > 0
 
+    def test_fuzzy_search_dotted_capital_i(self, temp_db):
+        """Test that names whose length changes when lowercased are still scored."""
+        temp_db.add_denied_person(DeniedPersonEntry(id="DP-TR-001", name="İİİİİİ", addresses=[]))
+
+        # Six dotted capitals lowercase to twelve characters
+        results = temp_db.search_denied_persons("i̇i̇i̇i̇i̇a", fuzzy_threshold=0.85)
+
+        assert [r.entry.id for r in results] == ["DP-TR-001"]
+
 
 class TestCountrySanctions:
     """Tests for country sanctions operations."""
@@ -222,3 +261,77 @@ class TestDatabaseUtilities:
         assert stats["entity_list"] == 0
         assert stats["sdn_list"] == 0
         assert stats["denied_persons"] == 0
+
+    def test_bulk_write_commits_once(self, temp_db, sample_entity):
+        """Test that entries added in bulk_write are committed together."""
+        second = sample_entity.model_copy(update={"id": "TEST-002", "name": "Second Co"})
+
+        with temp_db.bulk_write():
+            temp_db.add_entity_list_entry(second)
+            assert temp_db._get_connection().in_transaction
+
+        assert not temp_db._get_connection().in_transaction
+        assert temp_db.get_stats()["entity_list"] == 2
+
+    def test_bulk_write_rolls_back_on_error(self, temp_db, sample_entity):
+        """Test that a failing bulk_write leaves the database unchanged."""
+        second = sample_entity.model_copy(update={"id": "TEST-002", "name": "Second Co"})
+
+        with pytest.raises(RuntimeError), temp_db.bulk_write():
+            temp_db.add_entity_list_entry(second)
+            raise RuntimeError("ingest failed")
+
+        assert temp_db.get_stats()["entity_list"] == 1
+
+    def test_bulk_write_restores_pragmas(self, temp_db):
+        """Test that bulk settings are reverted and durability is unchanged."""
+        conn = temp_db._get_connection()
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+
+        with temp_db.bulk_write():
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == temp_store
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_bulk_write_restores_pragmas_when_locked(self, temp_db, tmp_path):
+        """Test that pragmas are restored when the write lock is unavailable."""
+        conn = temp_db._get_connection()
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        conn.execute("PRAGMA busy_timeout = 0")
+        other = sqlite3.connect(str(temp_db._db_path))
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            with pytest.raises(sqlite3.OperationalError), temp_db.bulk_write():
+                pass
+        finally:
+            other.rollback()
+            other.close()
+
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == temp_store
+        assert not temp_db._in_bulk_write
+
+
+class TestAsyncSearch:
+    """Tests for the thread-pool backed async search variants."""
+
+    async def test_asearch_matches_sync_search(self, temp_db, sample_entity):
+        """Test that async search returns the same results as sync search."""
+        sync_results = temp_db.search_entity_list("Test Corporation")
+        async_results = await temp_db.asearch_entity_list("Test Corporation")
+
+        assert [r.entry.id for r in async_results] == [r.entry.id for r in sync_results]
+
+    async def test_concurrent_searches(self, temp_db, sample_entity, sample_sdn):
+        """Test that concurrent searches on worker threads all succeed."""
+        import asyncio
+
+        entity_results, sdn_results = await asyncio.gather(
+            temp_db.asearch_entity_list("Test Corporation"),
+            temp_db.asearch_sdn_list("Test Bank"),
+        )
+
+        assert entity_results[0].entry.id == sample_entity.id
+        assert sdn_results[0].entry.id == sample_sdn.id
@@ -1,6 +1,7 @@
 """Tests for the vector store service."""
 
 from export_control_mcp.models.regulations import RegulationType
+from export_control_mcp.services.vector_store import metadata_to_chunk
 
 
 class TestVectorStoreService:
@@ -28,6 +29,22 @@ class TestVectorStoreService:
         assert vector_store.count(RegulationType.ITAR) == 1
         assert vector_store.count() == 2
 
+    def test_add_chunks_batch_splits_large_batches(self, vector_store, sample_ear_chunk):
+        """Test that batches larger than ADD_BATCH_MAX are added in slices."""
+        total = vector_store.ADD_BATCH_MAX * 2 + 7
+        chunks = [
+            sample_ear_chunk.model_copy(update={"id": f"ear:bulk:chunk-{i:03d}", "chunk_index": i})
+            for i in range(total)
+        ]
+        embeddings = [[float(i + 1), 1.0, 0.5] for i in range(total)]
+
+        vector_store.add_chunks_batch(chunks, embeddings)
+
+        assert vector_store.count(RegulationType.EAR) == total
+        last = vector_store.get_by_id(chunks[-1].id, RegulationType.EAR)
+        assert last is not None
+        assert last["chunk_index"] == total - 1
+
     def test_search_returns_results(self, populated_vector_store, embedding_service):
         """Test that search returns relevant results."""
         query = "export administration regulations"
@@ -59,6 +76,69 @@ class TestVectorStoreService:
         for metadata, _ in results:
             assert metadata["regulation_type"] == "itar"
 
+    def test_search_merges_collections_by_score(
+        self, vector_store, sample_ear_chunk, sample_itar_chunk
+    ):
+        """Test that an unfiltered search ranks hits from both collections together."""
+        vector_store.add_chunks_batch(
+            [sample_ear_chunk, sample_itar_chunk],
+            [[0.2, 1.0, 0.0], [1.0, 0.1, 0.0]],
+        )
+
+        results = vector_store.search(query_embedding=[1.0, 0.0, 0.0], limit=2)
+
+        assert [metadata["id"] for metadata, _ in results] == [
+            sample_itar_chunk.id,
+            sample_ear_chunk.id,
+        ]
+        assert results[0][1] > results[1][1]
+
+    def test_search_each_type_keeps_types_separate(
+        self, vector_store, sample_ear_chunk, sample_itar_chunk
+    ):
+        """Test that search_each_type returns each type's hits as a filtered search would."""
+        vector_store.add_chunks_batch(
+            [sample_ear_chunk, sample_itar_chunk],
+            [[0.2, 1.0, 0.0], [1.0, 0.1, 0.0]],
+        )
+        query_embedding = [1.0, 0.0, 0.0]
+
+        results = vector_store.search_each_type(query_embedding, limit=1)
+
+        assert set(results) == set(RegulationType)
+        for regulation_type, hits in results.items():
+            assert hits == vector_store.search(
+                query_embedding=query_embedding, regulation_type=regulation_type, limit=1
+            )
+        assert [metadata["id"] for metadata, _ in results[RegulationType.EAR]] == [
+            sample_ear_chunk.id
+        ]
+
+    def test_close_shuts_down_search_pool(self, vector_store, sample_ear_chunk):
+        """Test that close() stops the search pool and a later search restarts it."""
+        vector_store.add_chunk(sample_ear_chunk, [1.0, 0.0, 0.0])
+        vector_store.search_each_type([1.0, 0.0, 0.0], limit=1)
+        pool = vector_store._search_pool
+
+        vector_store.close()
+
+        assert pool is not None and pool._shutdown
+        assert vector_store._search_pool is None
+        results = vector_store.search_each_type([1.0, 0.0, 0.0], limit=1)
+        assert len(results[RegulationType.EAR]) == 1
+
+    def test_search_normalizes_part_filter(self, vector_store, sample_ear_chunk):
+        """Test that bare or lowercase part numbers match the stored part."""
+        vector_store.add_chunk(sample_ear_chunk, [1.0, 0.0, 0.0])
+
+        for part in ("Part 730", "730", "part 730"):
+            results = vector_store.search(
+                query_embedding=[1.0, 0.0, 0.0],
+                regulation_type=RegulationType.EAR,
+                part=part,
+            )
+            assert [metadata["id"] for metadata, _ in results] == [sample_ear_chunk.id]
+
     def test_get_by_id(self, vector_store, embedding_service, sample_ear_chunk):
         """Test retrieving a chunk by ID."""
         embedding = embedding_service.embed(sample_ear_chunk.to_embedding_text())
@@ -69,11 +149,44 @@ class TestVectorStoreService:
         assert result is not None
         assert result["citation"] == sample_ear_chunk.citation
 
+    def test_get_by_id_round_trips_chunk(self, vector_store, sample_ear_chunk):
+        """Test that a stored chunk is rebuilt from metadata and document text."""
+        vector_store.add_chunk(sample_ear_chunk, [1.0, 0.0, 0.5])
+
+        result = vector_store.get_by_id(sample_ear_chunk.id, RegulationType.EAR)
+
+        assert result is not None
+        assert "full_json" not in result
+        assert metadata_to_chunk(result) == sample_ear_chunk
+
+    def test_metadata_to_chunk_reads_legacy_full_json(self, sample_itar_chunk):
+        """Test that metadata written with a serialized full_json still decodes."""
+        metadata = {"full_json": sample_itar_chunk.model_dump_json()}
+
+        assert metadata_to_chunk(metadata) == sample_itar_chunk
+
     def test_get_by_id_not_found(self, vector_store):
         """Test get_by_id returns None for non-existent ID."""
         result = vector_store.get_by_id("nonexistent:id", RegulationType.EAR)
         assert result is None
 
+    def test_collection_created_with_hnsw_params(self, vector_store):
+        """Test that new collections carry the configured HNSW parameters."""
+        metadata = vector_store._get_collection(RegulationType.ITAR).metadata
+
+        assert metadata["hnsw:space"] == "cosine"
+        assert metadata["hnsw:M"] == 24
+        assert metadata["hnsw:search_ef"] == 100
+        # Build threads follow the host at runtime rather than being persisted
+        assert "hnsw:num_threads" not in metadata
+
+    def test_count_does_not_create_collections(self, vector_store):
+        """Test that counting an empty store leaves it without collections."""
+        assert vector_store.count() == 0
+        assert vector_store.count(RegulationType.EAR) == 0
+
+        assert list(vector_store.client.list_collections()) == []
+
     def test_delete_all(self, populated_vector_store):
         """Test deleting all chunks."""
         assert populated_vector_store.count() > 0
@@ -82,6 +195,15 @@ class TestVectorStoreService:
 
         assert populated_vector_store.count() == 0
 
+    def test_add_after_delete_all(self, vector_store, sample_ear_chunk):
+        """Test that a dropped collection is recreated on the next add."""
+        vector_store.add_chunk(sample_ear_chunk, [1.0, 0.0, 0.0])
+        vector_store.delete_all()
+
+        vector_store.add_chunk(sample_ear_chunk, [1.0, 0.0, 0.0])
+
+        assert vector_store.count(RegulationType.EAR) == 1
+
     def test_delete_by_type(self, populated_vector_store):
         """Test deleting chunks by regulation type."""
         assert populated_vector_store.count(RegulationType.EAR) > 0
@@ -98,6 +98,89 @@ class TestSuggestClassification:
         assert "suggested_jurisdiction" in result
         assert "suggested_eccns" in result
 
+    async def test_repeated_calls_return_independent_results(self):
+        """Test that mutating a (cached) result does not leak into later calls."""
+        from export_control_mcp.tools.classification import suggest_classification
+
+        func = suggest_classification.fn
+        first = await func("Software with encryption capabilities for network security")
+        first["next_steps"].append("caller note")
+
+        second = await func("Software with encryption capabilities for network security")
+
+        assert "caller note" not in second["next_steps"]
+        assert second["suggested_jurisdiction"] == first["suggested_jurisdiction"]
+
+
+@pytest.mark.asyncio
+class TestSuggestClassificationBatch:
+    """Tests for suggest_classification_batch tool."""
+
+    async def test_batch_matches_single_suggestions(self):
+        """Test that batch results equal per-item suggestions, in order."""
+        from export_control_mcp.tools.classification import (
+            suggest_classification,
+            suggest_classification_batch,
+        )
+
+        items = [
+            "Military weapon system with combat targeting and guidance",
+            "Commercial telecommunications equipment for consumer use",
+        ]
+        results = await suggest_classification_batch.fn(items, additional_context="For export")
+
+        assert len(results) == 2
+        for item, result in zip(items, results, strict=True):
+            assert result == await suggest_classification.fn(item, "For export")
+
+    async def test_batch_rejects_too_many_items(self):
+        """Test that oversized batches return an error instead of results."""
+        from export_control_mcp.tools.classification import suggest_classification_batch
+
+        results = await suggest_classification_batch.fn(["Test item"] * 51)
+
+        assert len(results) == 1
+        assert "error" in results[0]
+
+
+class TestAnalyzeDescription:
+    """Tests for the keyword scan behind suggest_classification."""
+
+    def test_overlapping_keywords_all_reported(self):
+        """Test that keywords nested inside longer keywords are still matched."""
+        from export_control_mcp.tools.classification import _analyze_description
+
+        analysis = _analyze_description("submarine laser weapon mount")
+
+        assert analysis["itar_keywords"] == ["weapon", "marine", "laser weapon", "submarine"]
+        assert analysis["itar_count"] == 4
+        assert analysis["ear_keywords"] == ["laser"]
+        assert analysis["categories"] == [6, 8]
+
+    def test_keyword_display_is_capped(self):
+        """Test that all matches are counted but only the first five are listed."""
+        from export_control_mcp.tools.classification import _analyze_description
+
+        analysis = _analyze_description("military defense weapon munition ordnance missile")
+
+        assert analysis["itar_count"] == 6
+        assert analysis["itar_keywords"] == [
+            "military",
+            "defense",
+            "weapon",
+            "munition",
+            "ordnance",
+        ]
+
+    def test_no_keywords(self):
+        """Test a description without any control-list terms."""
+        from export_control_mcp.tools.classification import _analyze_description
+
+        analysis = _analyze_description("wooden kitchen table")
+
+        assert analysis["itar_count"] == analysis["ear_count"] == 0
+        assert analysis["categories"] == []
+
 
 @pytest.mark.asyncio
 class TestClassificationDecisionTree:
@@ -162,6 +245,20 @@ class TestClassificationDecisionTree:
         assert "regulation_reference" in result["current_step"]
         assert "CFR" in result["current_step"]["regulation_reference"]
 
+    async def test_decision_tree_results_are_independent(self):
+        """Test that mutating a returned step does not alter the shared tree."""
+        from export_control_mcp.tools.classification import classification_decision_tree
+
+        func = classification_decision_tree.fn
+        first = await func("Test item", step=2)
+        first["current_step"]["options"].clear()
+        first["completed_steps"][0]["options"].clear()
+
+        second = await func("Test item", step=2)
+
+        assert len(second["current_step"]["options"]) > 0
+        assert len(second["completed_steps"][0]["options"]) > 0
+
 
 @pytest.mark.asyncio
 class TestCheckLicenseException:
@@ -257,6 +354,18 @@ class TestCheckLicenseException:
         ]
         assert len(not_eligible) > 0
 
+    async def test_repeated_calls_return_independent_results(self):
+        """Test that mutating a (cached) evaluation does not leak into later calls."""
+        from export_control_mcp.tools.classification import check_license_exception
+
+        func = check_license_exception.fn
+        first = await func(eccn="3A001", destination_country="DE")
+        first["exceptions_checked"].clear()
+
+        second = await func(eccn="3A001", destination_country="DE")
+
+        assert len(second["exceptions_checked"]) > 0
+
 
 @pytest.mark.asyncio
 class TestGetRecentUpdates:
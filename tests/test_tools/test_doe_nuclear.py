@@ -95,6 +95,14 @@ class TestGetCFR810Authorization:
         assert len(prohibited_list) == 4  # Cuba, Iran, North Korea, Syria
         assert "Iran" in prohibited_list
 
+    def test_get_all_lists_are_independent_copies(self):
+        """Test that modifying a returned list does not affect later calls."""
+        get_all_generally_authorized().append("Atlantis")
+        get_all_prohibited().clear()
+
+        assert "Atlantis" not in get_all_generally_authorized()
+        assert len(get_all_prohibited()) == 4
+
 
 class TestCFR810ReferenceData:
     """Tests for 10 CFR 810 reference data completeness and accuracy."""
@@ -50,6 +50,16 @@ class TestSearchEAR:
 
         assert results == []
 
+    async def test_repeated_query_reuses_embedding(self, rag_service):
+        """Test that repeating a query does not embed it again."""
+        query = "encryption export controls"
+        await rag_service.search_ear(query=query, limit=5)
+        await rag_service.search_ear(query=query, part="Part 740", limit=5)
+
+        cache_info = rag_service._embed_query.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
 
 @pytest.mark.asyncio
 class TestSearchITAR:
@@ -94,6 +104,23 @@ class TestSearchBoth:
         assert "ear" in reg_types
         assert "itar" in reg_types
 
+    async def test_search_both_matches_separate_searches(
+        self, rag_service, embedding_service, sample_ear_chunk, sample_itar_chunk
+    ):
+        """Test that search_both returns the same results as search_ear and search_itar."""
+        chunks = [sample_ear_chunk, sample_itar_chunk]
+        texts = [c.to_embedding_text() for c in chunks]
+        embeddings = embedding_service.embed_batch(texts)
+        rag_service._vector_store.add_chunks_batch(chunks, embeddings)
+
+        query = "export regulations and controls"
+        ear_results, itar_results = await rag_service.search_both(query, limit=5)
+
+        assert ear_results == await rag_service.search_ear(query=query, limit=5)
+        assert itar_results == await rag_service.search_itar(query=query, limit=5)
+        assert {r.chunk.regulation_type.value for r in ear_results} == {"ear"}
+        assert {r.chunk.regulation_type.value for r in itar_results} == {"itar"}
+
 
 @pytest.mark.asyncio
 class TestGetECCNDetails:
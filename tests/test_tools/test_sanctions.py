@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from export_control_mcp.models.sanctions import (
+    CountrySanctions,
     DeniedPersonEntry,
     EntityListEntry,
     EntityType,
@@ -189,6 +190,19 @@ class TestSearchSDNList:
             assert len(results) > 0
             assert results[0]["entry"]["type"] == "individual"
 
+    async def test_search_with_unknown_type_ignores_filter(self, sanctions_db):
+        """Test that an unrecognized entity type searches all types."""
+        from export_control_mcp.tools.sanctions import search_sdn_list
+
+        with patch(
+            "export_control_mcp.tools.sanctions.get_sanctions_db", return_value=sanctions_db
+        ):
+            func = search_sdn_list.fn
+
+            unfiltered = await func("Sanctioned")
+            results = await func("Sanctioned", entity_type="Submarine")
+            assert results == unfiltered
+
     async def test_search_by_program(self, sanctions_db):
         """Test SDN search with program filter."""
         from export_control_mcp.tools.sanctions import search_sdn_list
@@ -285,6 +299,28 @@ class TestCheckCountrySanctions:
 
             assert "error" in result
 
+    async def test_ingested_country_overrides_bundled_data(self, sanctions_db):
+        """Test that a database row takes precedence over bundled data by name."""
+        from export_control_mcp.tools.sanctions import check_country_sanctions
+
+        sanctions_db.add_country_sanctions(
+            CountrySanctions(
+                country_code="DE",
+                country_name="Germany",
+                embargo_type="targeted",
+                summary="Refreshed from the latest ingest",
+            )
+        )
+
+        with patch(
+            "export_control_mcp.tools.sanctions.get_sanctions_db", return_value=sanctions_db
+        ):
+            func = check_country_sanctions.fn
+            result = await func("Germany")
+
+            assert result["embargo_type"] == "targeted"
+            assert result["summary"] == "Refreshed from the latest ingest"
+
     async def test_check_by_country_code(self, sanctions_db):
         """Test checking sanctions using country code."""
         from export_control_mcp.tools.sanctions import check_country_sanctions